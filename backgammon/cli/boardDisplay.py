@@ -2,15 +2,131 @@
 # --- cli_boardDisplay.py ---
 # =========================================================
 
-from typing import Optional, Set, Iterable
-from core.board import BOARD_START, BOARD_END, BAR_FIELD, HOME_START, HOME_END
+import sys
+from functools import lru_cache
+from typing import List, Optional, Sequence, Set
+from core.board import BOARD_START, BOARD_END, BAR_FIELD, HOME_START, HOME_END, NUM_OF_ALL_STONES
 from core.state import BackgammonState
 
 from .cliColors import TColor, PLAYER
-from .cliUtils import clear
+from .cliUtils import clear, write_bytes
 
 # =========================================================
 
+class _FrameBuffer:
+    """
+    Byte buffer collecting one rendered frame before it is written to stdout.
+
+    All board output (ANSI sequences, point numbers, stone counts) is pure ASCII,
+    so the frame is assembled as bytes and written with a single call.
+
+    Attributes:
+        data (bytearray): The bytes of the frame built so far.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self) -> None:
+        self.data: bytearray = bytearray()
+
+    def append_ascii(self, chunk: bytes) -> None:
+        """Append raw ASCII bytes."""
+        self.data += chunk
+
+    def append_int(self, n: int) -> None:
+        """Append the decimal digits of an integer."""
+        self.data += b"%d" % n
+
+    def newline(self) -> None:
+        """Append a line break."""
+        self.data += b"\n"
+
+    def write(self) -> None:
+        """Write the frame to stdout with a single write and flush."""
+        write_bytes(bytes(self.data))
+        sys.stdout.flush()
+        self.data.clear()
+
+
+def _wrap_pair(color: str) -> tuple:
+    """Return the (prefix, suffix) byte pair wrapping text in the given TColor."""
+    return color.encode("ascii"), TColor.RESET.encode("ascii")
+
+
+#: Color key -> (prefix, suffix) bytes, used when colors are enabled
+_COLOR_WRAP = {
+    "blue": _wrap_pair(TColor.BLUE),
+    "red": _wrap_pair(TColor.RED),
+    "green": _wrap_pair(TColor.GREEN),
+    "yellow": _wrap_pair(TColor.YELLOW),
+    "purple": _wrap_pair(TColor.PURPLE),
+    "bold": _wrap_pair(TColor.BOLD),
+    "none": (b"", b""),
+}
+
+#: Same keys with empty wrappers, used when colors are disabled
+_PLAIN_WRAP = {key: (b"", b"") for key in _COLOR_WRAP}
+
+#: Highlight class of a point: bit 0 = move source, bit 1 = move target
+HL_NONE, HL_FROM, HL_TO, HL_BOTH = 0, 1, 2, 3
+
+#: Shared highlight classes for a frame without highlighted points
+_NO_HIGHLIGHT: tuple = (HL_NONE,) * (BOARD_END + 2)
+
+
+@lru_cache(maxsize=4096)
+def _render_point(blue: int, red: int, field_size: int, use_color: bool) -> bytes:
+    """
+    Render the stone cell of a board point.
+
+    Pure function of its arguments, so the result is cached across frames.
+
+    Args:
+        blue (int): Number of blue stones (player 0) on the point.
+        red (int): Number of red stones (player 1) on the point.
+        field_size (int): Width of the cell.
+        use_color (bool): Whether to wrap the cell in ANSI colors.
+
+    Returns:
+        bytes: The rendered cell.
+    """
+    wrap = _COLOR_WRAP if use_color else _PLAIN_WRAP
+    if blue:
+        pre, suf = wrap["blue"]
+        return pre + (b"B%d" % blue).rjust(field_size) + suf  # Right-align the text
+    if red:
+        pre, suf = wrap["red"]
+        return pre + (b"R%d" % red).rjust(field_size) + suf
+    return b"..."  # Empty point
+
+
+@lru_cache(maxsize=256)
+def _render_index(point: int, in_from: bool, in_to: bool, field_size: int, use_color: bool) -> bytes:
+    """
+    Render the point number cell with its move highlight.
+
+    Args:
+        point (int): The board point number.
+        in_from (bool): Whether the point is a move source.
+        in_to (bool): Whether the point is a move target.
+        field_size (int): Width of the cell.
+        use_color (bool): Whether to wrap the cell in ANSI colors.
+
+    Returns:
+        bytes: The rendered cell.
+    """
+    if in_from and in_to:
+        key = "purple"
+    elif in_from:
+        key = "green"
+    elif in_to:
+        key = "yellow"
+    else:
+        key = "none"
+    pre, suf = (_COLOR_WRAP if use_color else _PLAIN_WRAP)[key]
+    return pre + (b"%d" % point).rjust(field_size) + suf
+
+
 class BoardDisplay:
     """
     Class for displaying the Backgammon board in the terminal.
@@ -20,8 +136,17 @@ class BoardDisplay:
         clear_screen (bool): Whether to clear the screen before drawing.
         field_size (int): Width of a board point for formatting.
         use_color (bool): Whether to use colored output.
+        _wrap (dict): Color key -> (prefix, suffix) bytes, chosen once from use_color.
+        _blue_cell (tuple): Rendered stone cells for 0-15 blue stones, indexed by count.
+        _red_cell (tuple): Rendered stone cells for 0-15 red stones, indexed by count.
+        _idx_cell (tuple): Rendered point numbers 0-25, indexed by [highlight class][point].
     """
 
+    __slots__ = (
+        "state", "clear_screen", "field_size", "use_color",
+        "_wrap", "_blue_cell", "_red_cell", "_idx_cell",
+    )
+
     def __init__(self, state: 'BackgammonState', clear_screen: bool = True, use_color: bool = True) -> None:
         """
         Initializes the BoardDisplay.
@@ -35,36 +160,49 @@ class BoardDisplay:
         self.clear_screen: bool = clear_screen
         self.field_size: int = 3  # Width of each board point for alignment
         self.use_color: bool = use_color
+        self._wrap: dict = _COLOR_WRAP if use_color else _PLAIN_WRAP
 
-    def _point_str(self, point: int) -> str:
+        # Padded cells for every possible count / point, so drawing is a table lookup
+        max_stones = max(NUM_OF_ALL_STONES)
+        self._blue_cell: tuple = tuple(_render_point(n, 0, self.field_size, use_color) for n in range(max_stones + 1))
+        self._red_cell: tuple = tuple(_render_point(0, n, self.field_size, use_color) for n in range(max_stones + 1))
+        self._idx_cell: tuple = tuple(
+            tuple(_render_index(p, bool(hl & HL_FROM), bool(hl & HL_TO), self.field_size, use_color) for p in range(BOARD_END + 2))
+            for hl in (HL_NONE, HL_FROM, HL_TO, HL_BOTH)
+        )
+
+    def _colored(self, buf: _FrameBuffer, color: str, text: bytes) -> None:
         """
-        Returns a formatted string representing a board point, including colored stones.
+        Appends text to the frame, wrapped in the given color if colors are enabled.
+
+        Args:
+            buf (_FrameBuffer): The frame being built.
+            color (str): Color key of the wrap table (e.g. "blue").
+            text (bytes): ASCII text to append.
+        """
+        pre, suf = self._wrap[color]
+        buf.append_ascii(pre + text + suf)
+
+    def _point_str(self, point: int, blue_counts: List[int], red_counts: List[int]) -> bytes:
+        """
+        Returns the formatted cell of a board point, including colored stones.
 
         Args:
             point (int): The board point number.
+            blue_counts (List[int]): Per-point stone counts of player 0.
+            red_counts (List[int]): Per-point stone counts of player 1.
 
         Returns:
-            str: Formatted string for the point.
+            bytes: Rendered cell for the point.
         """
-        blue_stones = self.state.num_of_stones(point, 0)
-        red_stones = self.state.num_of_stones(point, 1)
-
-        if blue_stones:
-            s = f"B{blue_stones}".rjust(self.field_size)  # Right-align the text
-            return f"{TColor.BLUE}{s}{TColor.RESET}" if self.use_color else s
-        if red_stones:
-            s = f"R{red_stones}".rjust(self.field_size)
-            return f"{TColor.RED}{s}{TColor.RESET}" if self.use_color else s
-        return "..."  # Empty point
+        blue = blue_counts[point]
+        if blue:
+            return self._blue_cell[blue]
+        return self._red_cell[red_counts[point]]  # count 0 is the empty point
 
-    def _color_index(
-        self,
-        point: int,
-        from_points: Optional[Iterable[int]] = None,
-        to_points: Optional[Iterable[int]] = None
-    ) -> str:
+    def _color_index(self, point: int, highlight: Sequence[int] = _NO_HIGHLIGHT) -> bytes:
         """
-        Returns a formatted point string with color coding for moves.
+        Returns the formatted point number with color coding for moves.
 
         - GREEN: point is a source (stone moving from)
         - YELLOW: point is a target (stone moving to)
@@ -73,26 +211,55 @@ class BoardDisplay:
 
         Args:
             point (int): The board point number.
-            from_points (Optional[Iterable[int]]): Points where stones are moving from.
-            to_points (Optional[Iterable[int]]): Points where stones are moving to.
+            highlight (Sequence[int]): Highlight class (HL_*) of every point, indexed by point.
 
         Returns:
-            str: Colored or formatted point string.
+            bytes: Rendered index cell for the point.
         """
-        from_points = from_points or set()
-        to_points = to_points or set()
+        return self._idx_cell[highlight[point]][point]
 
-        s = f"{point}".rjust(self.field_size)
-        # Apply color coding based on move highlights
-        if point in from_points and point in to_points:
-            return f"{TColor.PURPLE}{s}{TColor.RESET}" if self.use_color else s
-        if point in from_points:
-            return f"{TColor.GREEN}{s}{TColor.RESET}" if self.use_color else s
-        if point in to_points:
-            return f"{TColor.YELLOW}{s}{TColor.RESET}" if self.use_color else s
-        return s
+    @staticmethod
+    def _highlight_classes(from_points: Optional[Set[int]], to_points: Optional[Set[int]]) -> Sequence[int]:
+        """
+        Builds the per-point highlight classes for a frame.
 
-    def draw_points(self, from_points: Optional[Set[int]] = None, to_points: Optional[Set[int]] = None) -> None:
+        Args:
+            from_points (Optional[Set[int]]): Points stones are moving from.
+            to_points (Optional[Set[int]]): Points stones are moving to.
+
+        Returns:
+            Sequence[int]: Highlight class (HL_*) of every point 0-25.
+        """
+        if not from_points and not to_points:
+            return _NO_HIGHLIGHT
+        highlight = [HL_NONE] * (BOARD_END + 2)
+        for p in from_points or ():
+            highlight[p] |= HL_FROM
+        for p in to_points or ():
+            highlight[p] |= HL_TO
+        return highlight
+
+    def _home_label(self, color: str, label: bytes, width: int) -> bytes:
+        """
+        Returns a right-aligned, colored home board label.
+
+        Args:
+            color (str): Color key of the wrap table (e.g. "blue").
+            label (bytes): ASCII label text.
+            width (int): Alignment width (the color prefix counts towards it).
+
+        Returns:
+            bytes: The padded label line (without line break).
+        """
+        pre, suf = self._wrap[color]
+        return b" " * (width - len(pre) - len(label)) + pre + label + suf
+
+    def draw_points(
+        self,
+        from_points: Optional[Set[int]] = None,
+        to_points: Optional[Set[int]] = None,
+        buf: Optional[_FrameBuffer] = None
+    ) -> None:
         """
         Draws all board points including move color highlights.
 
@@ -103,61 +270,89 @@ class BoardDisplay:
         Args:
             from_points (Optional[Set[int]]): Points stones are moving from.
             to_points (Optional[Set[int]]): Points stones are moving to.
+            buf (Optional[_FrameBuffer]): Frame to append to. If None, the output is written directly.
         """
-        from_points = from_points or set()
-        to_points = to_points or set()
+        frame = buf or _FrameBuffer()
+        highlight = self._highlight_classes(from_points, to_points)
+
+        point_str = self._point_str
+        blue_counts, red_counts = self.state.stones_by_player
+        color_idx = self._color_index
 
         half = (BOARD_END - BOARD_START + 1) // 2
-        sep = " "
+        sep = b" "
         home_format = (half - 1) * len(sep) + half * self.field_size
 
-        # Upper half (typically Red home)
+        # Upper half (typically Red home), lower half (typically Blue home, reversed order)
         upper_range = range(half + 1, BOARD_END + 1)
-        upper_idx = sep.join(self._color_index(p, from_points, to_points) for p in upper_range)
-        upper_points = sep.join(self._point_str(p) for p in upper_range)
-        print(f"{TColor.RED if self.use_color else ''}HOME R ({HOME_START[1]}-{HOME_END[1]})".rjust(home_format) + (TColor.RESET if self.use_color else ''))
-        print(upper_idx)    # Index row with move highlights
-        print(upper_points) # Stone count row
-
-        # Lower half (typically Blue home, reversed order)
         lower_range = range(half, BOARD_START - 1, -1)
-        lower_points = sep.join(self._point_str(p) for p in lower_range)
-        lower_idx = sep.join(self._color_index(p, from_points, to_points) for p in lower_range)
-        print(lower_points)
-        print(lower_idx)
-        print(f"{TColor.BLUE if self.use_color else ''}HOME B ({HOME_START[0]}-{HOME_END[0]})".rjust(home_format) + (TColor.RESET if self.use_color else ''))
 
-    def draw_bar(self) -> None:
+        rows = [
+            self._home_label("red", b"HOME R (%d-%d)" % (HOME_START[1], HOME_END[1]), home_format),
+            sep.join([color_idx(p, highlight) for p in upper_range]),                   # Index row with move highlights
+            sep.join([point_str(p, blue_counts, red_counts) for p in upper_range]),     # Stone count row
+            sep.join([point_str(p, blue_counts, red_counts) for p in lower_range]),
+            sep.join([color_idx(p, highlight) for p in lower_range]),
+            self._home_label("blue", b"HOME B (%d-%d)" % (HOME_START[0], HOME_END[0]), home_format),
+        ]
+        frame.append_ascii(b"\n".join(rows))
+        frame.newline()
+
+        if buf is None:
+            frame.write()
+
+    def draw_bar(self, buf: Optional[_FrameBuffer] = None) -> None:
         """
         Draws the bar (captured stones) for both players.
+
+        Args:
+            buf (Optional[_FrameBuffer]): Frame to append to. If None, the output is written directly.
         """
+        frame = buf or _FrameBuffer()
         blue, red = 0, 1
         b_count = self.state.num_of_stones(BAR_FIELD[blue], blue)
         r_count = self.state.num_of_stones(BAR_FIELD[red], red)
-        print(f"Bar  "
-              f"{TColor.BLUE + 'B:' + str(b_count) + TColor.RESET if self.use_color else 'B:'+str(b_count)} | "
-              f"{TColor.RED + 'R:' + str(r_count) + TColor.RESET if self.use_color else 'R:'+str(r_count)}")
+        frame.append_ascii(b"Bar  ")
+        self._colored(frame, "blue", b"B:%d" % b_count)
+        frame.append_ascii(b" | ")
+        self._colored(frame, "red", b"R:%d" % r_count)
+        frame.newline()
+        if buf is None:
+            frame.write()
 
-    def draw_bear_off(self) -> None:
+    def draw_bear_off(self, buf: Optional[_FrameBuffer] = None) -> None:
         """
         Draws the bear-off area (stones that have been removed from the board) for both players.
+
+        Args:
+            buf (Optional[_FrameBuffer]): Frame to append to. If None, the output is written directly.
         """
+        frame = buf or _FrameBuffer()
         blue, red = 0, 1
-        print(f"Bear "
-              f"{TColor.BLUE + 'B:' + str(self.state.bear_off_stones[blue]) + TColor.RESET if self.use_color else 'B:'+str(self.state.bear_off_stones[blue])} | "
-              f"{TColor.RED + 'R:' + str(self.state.bear_off_stones[red]) + TColor.RESET if self.use_color else 'R:'+str(self.state.bear_off_stones[red])}")
+        frame.append_ascii(b"Bear ")
+        self._colored(frame, "blue", b"B:%d" % self.state.bear_off_stones[blue])
+        frame.append_ascii(b" | ")
+        self._colored(frame, "red", b"R:%d" % self.state.bear_off_stones[red])
+        frame.newline()
+        if buf is None:
+            frame.write()
 
     def draw_all(self, from_points: Optional[Set[int]] = None, to_points: Optional[Set[int]] = None) -> None:
         """
         Draws the entire board, including points, bar, and bear-off areas.
 
+        The whole frame is assembled in one buffer and written with a single write.
+
         Args:
             from_points (Optional[Set[int]]): Points stones are moving from.
             to_points (Optional[Set[int]]): Points stones are moving to.
         """
         if self.clear_screen:
             clear()  # Clear terminal for clean board display
-        print(f"{TColor.BOLD + '--- Board ---' + TColor.RESET if self.use_color else '--- Board ---'}")
-        self.draw_points(from_points, to_points)
-        self.draw_bar()
-        self.draw_bear_off()
+        frame = _FrameBuffer()
+        self._colored(frame, "bold", b"--- Board ---")
+        frame.newline()
+        self.draw_points(from_points, to_points, frame)
+        self.draw_bar(frame)
+        self.draw_bear_off(frame)
+        frame.write()
@@ -32,3 +32,6 @@ PLAYER: Tuple[str, str] = (
     f"{TColor.BLUE}(B)lue{TColor.RESET}",  # Player 0 display string
     f"{TColor.RED}(R)ed{TColor.RESET}"     # Player 1 display string
 )
+
+#: Dice emoji strings indexed by number of dice (0-4)
+DICE_EMOJI: Tuple[str, ...] = tuple("🎲" * n for n in range(5))
@@ -2,10 +2,11 @@
 # --- cli_cliHandlers.py ---
 # =========================================================
 
+import threading
 from typing import Any, Dict, Callable
 
-from .cliColors import PLAYER
-from .cliUtils import interruptible_sleep, clear
+from .cliColors import PLAYER, DICE_EMOJI
+from .cliUtils import interruptible_sleep, clear, write_bytes
 from .boardDisplay import BoardDisplay
 
 # =========================================================
@@ -16,8 +17,16 @@ class CLIHandlers:
 
     Attributes:
         delay (float): Delay in seconds between event prints to allow user to follow the game.
+        _cancel (threading.Event): Set by cancel() to skip all remaining delays.
+        board (BoardDisplay): Board renderer reused for every event.
     """
 
+    __slots__ = (
+        "delay", "_cancel", "board",
+        "_label_B", "_label_R", "_tpl_start", "_tpl_rolls", "_tpl_bear_off", "_tpl_thinks", "_tpl_no_moves",
+        "_label", "_b_chose", "_b_apply", "_b_turn_end",
+    )
+
     def __init__(self, delay: float = 1.5):
         """
         Initialize the CLI handler with optional delay.
@@ -26,6 +35,32 @@ class CLIHandlers:
             delay (float): Sleep duration between events (default 1.5 seconds).
         """
         self.delay: float = delay
+        self._cancel: threading.Event = threading.Event()
+        self.board: BoardDisplay = BoardDisplay(None, clear_screen=True)
+
+        # Constant output, built once instead of per event
+        self._label_B: str = PLAYER[0]
+        self._label_R: str = PLAYER[1]
+        self._tpl_start: str = "\nRolling start dice 🎲🎲 ...:\n"
+        self._tpl_rolls: tuple = (f"{self._label_B} rolls 🎲: ", f"{self._label_R} rolls 🎲: ")
+        self._tpl_bear_off: str = "\nBearing off allowed!\n"
+        self._tpl_thinks: str = "\nComputer thinks 🤔 ... Please be patient 😄"
+        self._tpl_no_moves: str = "\nNo legal moves available!\n"
+
+        # Pre-encoded output for the per-move handlers
+        self._label: tuple = (self._label_B.encode(), self._label_R.encode())
+        self._b_chose: bytes = b" chose "
+        self._b_apply: bytes = b"\nApply move: "
+        self._b_turn_end: bytes = b"\nTurn ended. Next player: "
+
+    def cancel(self) -> None:
+        """Interrupt the current delay and skip all following ones (e.g. from a keyboard thread)."""
+        self._cancel.set()
+
+    def _draw_board(self, state: Any) -> None:
+        """Draw the given state with the shared board renderer."""
+        self.board.state = state
+        self.board.draw_all()
 
     # ---------------- Event Handlers ----------------
     def handle_start_roll(self, event: Dict[str, Any]) -> None:
@@ -35,11 +70,11 @@ class CLIHandlers:
         Args:
             event (dict): Event data with 'dice' and 'turn' keys.
         """
-        print(f"\nRolling start dice 🎲🎲 ...:\n")
-        print(f"{PLAYER[0]} rolls 🎲: {event['dice'][0]}")
-        print(f"{PLAYER[1]} rolls 🎲: {event['dice'][1]}")
+        print(self._tpl_start)
+        print(f"{self._tpl_rolls[0]}{event['dice'][0]}")
+        print(f"{self._tpl_rolls[1]}{event['dice'][1]}")
         print(f"\n=> {PLAYER[event['turn']]} starts.")
-        interruptible_sleep(self.delay)
+        interruptible_sleep(self.delay, self._cancel)
 
     def handle_turn_start(self, event: Dict[str, Any]) -> None:
         """
@@ -48,11 +83,11 @@ class CLIHandlers:
         Args:
             event (dict): Event data with 'state', 'turn', and 'bear_off_allowed'.
         """
-        BoardDisplay(event["state"]).draw_all()
+        self._draw_board(event["state"])
         print(f"\nTurn: {PLAYER[event['turn']]}")
         if event['bear_off_allowed']:
-            print(f"\nBearing off allowed!\n")
-        interruptible_sleep(self.delay)
+            print(self._tpl_bear_off)
+        interruptible_sleep(self.delay, self._cancel)
 
     def handle_doubling_cube(self, event: Dict[str, Any]) -> None:
         """
@@ -64,7 +99,7 @@ class CLIHandlers:
         if event['offered']:
             print(f"\nTurn: {PLAYER[event['turn']]}; Cube offered? {event['offered']}; "
                   f"Accepted? {event['accepted']}; Cube Value: {event['cube_value']}\n")
-            interruptible_sleep(self.delay)
+            interruptible_sleep(self.delay, self._cancel)
 
     def handle_roll_dice(self, event: Dict[str, Any]) -> None:
         """
@@ -73,16 +108,16 @@ class CLIHandlers:
         Args:
             event (dict): Event data with 'dice', 'turn', and optionally 'player_type'.
         """
-        print(f"\n{PLAYER[event['turn']]} rolled " + "🎲" * len(event['dice']) + f": {event['dice']}\n")
+        print(f"\n{PLAYER[event['turn']]} rolled {DICE_EMOJI[len(event['dice'])]}: {event['dice']}\n")
 
         player_type = event.get("player_type")
         print(f"({player_type})")
 
         if player_type in ("ComputerPlayer(0)", "ComputerPlayer(1)"):
-            print(f"\nComputer thinks 🤔 ... Please be patient 😄")
-            interruptible_sleep(self.delay)
+            print(self._tpl_thinks)
+            interruptible_sleep(self.delay, self._cancel)
 
-        interruptible_sleep(self.delay)
+        interruptible_sleep(self.delay, self._cancel)
 
     def handle_no_moves(self, event: Dict[str, Any]) -> None:
         """
@@ -91,8 +126,8 @@ class CLIHandlers:
         Args:
             event (dict): Event data with 'turn'.
         """
-        print(f"\nNo legal moves available!\n")
-        interruptible_sleep(self.delay)
+        print(self._tpl_no_moves)
+        interruptible_sleep(self.delay, self._cancel)
 
     def handle_chosen_move(self, event: Dict[str, Any]) -> None:
         """
@@ -101,8 +136,8 @@ class CLIHandlers:
         Args:
             event (dict): Event data with 'turn' and 'move'.
         """
-        print(f"\n{PLAYER[event['turn']]} chose {event['move']}")
-        interruptible_sleep(self.delay)
+        write_bytes(b"\n" + self._label[event['turn']] + self._b_chose + str(event['move']).encode() + b"\n")
+        interruptible_sleep(self.delay, self._cancel)
 
     def handle_apply_move(self, event: Dict[str, Any]) -> None:
         """
@@ -111,11 +146,14 @@ class CLIHandlers:
         Args:
             event (dict): Event data with 'state' and 'move'.
         """
-        BoardDisplay(event["state"]).draw_all()
-        print(f"\nApply move: {event['move']}")
-        interruptible_sleep(self.delay)
-        BoardDisplay(event["state"]).draw_all()
-        interruptible_sleep(self.delay)
+        state = event["state"]
+        version = state.version
+        self._draw_board(state)
+        write_bytes(self._b_apply + str(event['move']).encode() + b"\n")
+        interruptible_sleep(self.delay, self._cancel)
+        if state.version != version:  # only redraw if the state changed meanwhile
+            self._draw_board(state)
+        interruptible_sleep(self.delay, self._cancel)
 
     def handle_turn_end(self, event: Dict[str, Any]) -> None:
         """
@@ -124,8 +162,8 @@ class CLIHandlers:
         Args:
             event (dict): Event data with 'next_turn'.
         """
-        print(f"\nTurn ended. Next player: {PLAYER[event['next_turn']]}")
-        interruptible_sleep(self.delay)
+        write_bytes(self._b_turn_end + self._label[event['next_turn']] + b"\n")
+        interruptible_sleep(self.delay, self._cancel)
 
     def handle_game_over(self, event: Dict[str, Any]) -> None:
         """
@@ -134,7 +172,7 @@ class CLIHandlers:
         Args:
             event (dict): Event data with 'state', 'winner', 'player_type', 'points', and 'result_type'.
         """
-        BoardDisplay(event["state"]).draw_all()
+        self._draw_board(event["state"])
         print(f"\nGame Over! Winner: {PLAYER[event['winner']]} ({event['player_type']}), "
               f"Points: {event['points']}, Type: {event['result_type']}\n")
 
@@ -2,6 +2,8 @@
 # --- cli_cliHumanInterface.py ---
 # =========================================================
 import copy
+import sys
+from itertools import groupby
 from typing import List, Dict, Any
 
 from core.moves import SingleMoveType, SingleMove, TurnMove
@@ -9,7 +11,8 @@ from core.state import BackgammonState
 from core.generator import MoveTree
 
 from .boardDisplay import BoardDisplay
-from .cliUtils import interruptible_sleep, safe_input, clear
+from .cliColors import DICE_EMOJI
+from .cliUtils import interruptible_sleep, safe_input, safe_getch, clear
 
 # =========================================================
 
@@ -19,6 +22,11 @@ class HumanMoveNavigator:
     possible turn moves and select a sequence of SingleMoves.
     """
 
+    __slots__ = (
+        "state", "tree", "board_display", "current_path", "state_copy", "dice", "dice_all",
+        "_node_stack",
+    )
+
     def __init__(self, state: BackgammonState, turn_moves: List[TurnMove], dice: List[int]):
         """
         Initialize the navigator with the game state, possible turn moves, and dice.
@@ -35,6 +43,7 @@ class HumanMoveNavigator:
         self.state_copy: BackgammonState = state.copy()
         self.dice: List[int] = dice.copy()
         self.dice_all: List[int] = dice.copy()
+        self._node_stack: List[Dict[SingleMove, Any]] = [self.tree.root]  # tree node after each path move
 
     # ---------------- Main method ----------------
     def navigate(self) -> TurnMove:
@@ -59,9 +68,24 @@ class HumanMoveNavigator:
             self._display_board(options)
             self._display_options(options)
 
-            choice: str = safe_input("\nYour choice: ")
+            choice: str = self._read_choice(len(options))
             node = self._handle_choice(choice, node, options)
 
+    def _read_choice(self, num_options: int) -> str:
+        """
+        Read the player's choice, as a single key press when all options fit in one digit.
+
+        Args:
+            num_options (int): Number of displayed options.
+
+        Returns:
+            str: Player input.
+        """
+        if num_options > 9:
+            return safe_input("\nYour choice: ")
+        keys = {str(i) for i in range(1, num_options + 1)} | {"b"}
+        return safe_getch("\nYour choice: ", keys)
+
     # ---------------- Leaf handling ----------------
     def _handle_leaf(self) -> bool:
         """
@@ -73,10 +97,11 @@ class HumanMoveNavigator:
         """
         print("\n✅ TurnMove complete:")
         print(" | ".join(str(m) for m in self.current_path))
-        confirm: str = safe_input("Confirm this sequence? (y/n): ")
+        confirm: str = safe_getch("Confirm this sequence? (y/n): ", {"y", "n"})
         if confirm.lower() == "y":
             return True
         self.current_path.clear()
+        del self._node_stack[1:]
         self.state_copy = self.state.copy()
         self.dice = self.dice_all.copy()
         return False
@@ -102,16 +127,18 @@ class HumanMoveNavigator:
         Args:
             options (List[SingleMove]): List of single moves to display.
         """
-        print("Dice " + "🎲" * len(self.dice) + f": {self.dice}\n")
+        parts: List[str] = [f"Dice {DICE_EMOJI[len(self.dice)]}: {self.dice}\n"]
+
+        idx = 1
+        for die, group in groupby(options, key=lambda m: m.die):
+            parts.append(f"\nDie 🎲: {die}\n")
+            for move in group:
+                parts.append(f"{idx}: {move}")
+                idx += 1
+        parts.append("\nb: go back")
 
-        last_die = None
-        for idx, move in enumerate(options, 1):
-            die = move.die
-            if last_die != die:
-                last_die = die
-                print(f"\nDie 🎲: {die}\n")
-            print(f"{idx}: {move}")
-        print("\nb: go back")
+        sys.stdout.write("\n".join(parts))
+        sys.stdout.write("\n")
 
     # ---------------- Handle choice / backtracking ----------------
     def _handle_choice(self, choice: str, node: Dict[SingleMove, Any], options: List[SingleMove]) -> Dict[SingleMove, Any]:
@@ -129,11 +156,7 @@ class HumanMoveNavigator:
         """
         if choice.lower() == "b":
             self._go_back()
-            # Reset tree node according to current path
-            new_node: Dict[SingleMove, Any] = self.tree.root
-            for m in self.current_path:
-                new_node = new_node[m]
-            return new_node
+            return self._node_stack[-1]
 
         if not choice.isdigit() or not (1 <= int(choice) <= len(options)):
             print("Invalid choice, please try again.")
@@ -145,6 +168,7 @@ class HumanMoveNavigator:
         self.state_copy.apply_move(move)
         self.current_path.append(move)
         self.dice.remove(move.die)
+        self._node_stack.append(node[move])
         return node[move]
 
     def _go_back(self) -> None:
@@ -158,3 +182,4 @@ class HumanMoveNavigator:
         last_move: SingleMove = self.current_path.pop()
         self.state_copy.undo_move(last_move)
         self.dice.append(last_move.die)
+        self._node_stack.pop()
@@ -2,14 +2,22 @@
 # --- cli_cliUtils.py ---
 # =========================================================
 import os
-import time
+import sys
+import threading
+from typing import Optional, Set
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import termios
+    import tty
 
 # =========================================================
 
 class ExitGame(Exception):
     """
     Custom exception to indicate that the player wants to quit the game.
-    Raised by `safe_input` when the user types 'q', 'quit', or presses Ctrl+C.
+    Raised by `safe_input`/`safe_getch` when the user types 'q', 'quit', or presses Ctrl+C.
     """
     pass
 
@@ -37,23 +45,126 @@ def safe_input(prompt: str) -> str:
     return inp
 
 
-def interruptible_sleep(seconds: float) -> None:
+def _read_key() -> str:
+    """
+    Read a single key press from the terminal without waiting for Enter.
+
+    Returns:
+        str: The character read.
     """
-    Sleep for a given number of seconds in small intervals,
-    allowing interruptions or responsive UI updates.
+    if os.name == 'nt':
+        return msvcrt.getwch()
+    fd = sys.stdin.fileno()
+    old = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        return sys.stdin.read(1)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old)
+
+
+def safe_getch(prompt: str, accept: Set[str]) -> str:
+    """
+    Prompt the user for a single key press, handling keyboard interrupts
+    and the quit key.
+
+    Keys not in `accept` are ignored. Falls back to `safe_input` if stdin
+    is not a terminal.
+
+    Args:
+        prompt (str): The input prompt to display.
+        accept (Set[str]): Lowercase characters that are valid answers.
+
+    Raises:
+        ExitGame: If the user presses Ctrl+C or 'q'.
+
+    Returns:
+        str: The accepted character (lowercase).
+    """
+    if not sys.stdin.isatty():
+        return safe_input(prompt)
+
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    while True:
+        try:
+            key: str = _read_key().lower()
+        except KeyboardInterrupt:
+            raise ExitGame()
+        if key in ("\x03", "q"):
+            raise ExitGame()
+        if key in accept:
+            sys.stdout.write(key + "\n")  # echo the answer like input() would
+            sys.stdout.flush()
+            return key
+
+
+#: Never-set event used when the caller provides no cancel event
+_NO_CANCEL = threading.Event()
+
+
+def interruptible_sleep(seconds: float, cancel: Optional[threading.Event] = None) -> None:
+    """
+    Sleep for a given number of seconds, returning early if the cancel event is set.
+
+    Blocks once on the event instead of polling, and still reacts to Ctrl+C.
 
     Args:
         seconds (float): Total duration to sleep in seconds.
+        cancel (Optional[threading.Event]): Event that ends the sleep when set.
+    """
+    sys.stdout.flush()  # show pending output before blocking
+    (cancel or _NO_CANCEL).wait(seconds)
+
+
+def write_bytes(data: bytes) -> None:
     """
-    start: float = time.time()
-    while time.time() - start < seconds:
-        time.sleep(0.05)
+    Write already encoded UTF-8 output to stdout, bypassing the text encoder.
+
+    Pending text output is flushed first so the order of prints is kept.
+    Falls back to a text write if stdout has no binary buffer.
+
+    Args:
+        data (bytes): UTF-8 encoded output.
+    """
+    out = sys.stdout
+    raw = getattr(out, "buffer", None)
+    if raw is None:
+        out.write(data.decode("utf-8"))
+        return
+    out.flush()
+    raw.write(data)
+
+
+#: ANSI sequence: cursor home + clear screen
+CLEAR_SCREEN: str = "\x1b[H\x1b[2J"
+
+
+def enable_ansi() -> None:
+    """
+    Enable ANSI escape processing in the terminal.
+    Only needed on Windows consoles; call once at startup.
+    """
+    if os.name == 'nt':
+        os.system('')
+
+
+def use_block_buffering() -> None:
+    """
+    Switch stdout from line buffering to block buffering; call once at startup.
+
+    Prints are then collected and written in larger chunks. Output is flushed
+    explicitly before sleeping, after each board frame, and by input().
+    """
+    reconfigure = getattr(sys.stdout, "reconfigure", None)
+    if reconfigure is not None:
+        reconfigure(line_buffering=False, write_through=False)
 
 
 def clear() -> None:
     """
     Clear the terminal screen.
-    Uses 'cls' on Windows and 'clear' on Unix-based systems.
+    Writes an ANSI escape sequence instead of spawning 'cls'/'clear'.
     """
-    os.system('cls' if os.name == 'nt' else 'clear')
-
+    sys.stdout.write(CLEAR_SCREEN)
+    sys.stdout.flush()
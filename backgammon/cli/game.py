@@ -13,7 +13,7 @@ from players.random import RandomPlayer
 from players.computer import ComputerPlayer
 
 from .cliColors import PLAYER
-from .cliUtils import ExitGame, interruptible_sleep, safe_input, clear
+from .cliUtils import ExitGame, interruptible_sleep, safe_input, clear, enable_ansi, use_block_buffering
 from .cliHumanInterface import HumanMoveNavigator
 from .cliHandlers import CLIHandlers
 
@@ -133,6 +133,8 @@ class BackgammonCLI:
             delay (float): Delay in seconds between UI updates.
             stepwise (bool): Whether to run the engine in stepwise mode.
         """
+        enable_ansi()
+        use_block_buffering()
         self.setup = CLISetup()
         self.handlers = CLIHandlers(delay).handlers
         self.stepwise = stepwise
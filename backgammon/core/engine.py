@@ -6,6 +6,8 @@ import random
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
+import numpy as np
+
 from players.player import Player
 
 from .rules import BackgammonRules, GameResult
@@ -15,7 +17,12 @@ from .generator import TurnMoveGenerator
 
 # ========================================================
 
-@dataclass
+#: Number of dice drawn from the NumPy generator per buffer refill.
+DICE_BUFFER_SIZE = 4096
+
+# ========================================================
+
+@dataclass(frozen=True, slots=True)
 class CubeDecision:
     """
     Represents a doubling cube decision during a turn.
@@ -30,6 +37,10 @@ class CubeDecision:
     result: Optional[GameResult]
 
 
+#: Shared decision for "no double offered" (CubeDecision is immutable).
+_NO_OFFER = CubeDecision(False, None, None)
+
+
 class EngineEvents:
     """
     Event factory for game engine events. 
@@ -137,10 +148,17 @@ class GameEngine:
         undo (Undo): Undo manager for moves and snapshots.
         emit_enabled (bool): If True, yield events during play.
         events (EngineEvents): Event generator for logging/UI.
+        tmgen (TurnMoveGenerator): Turn move generator, shared by all legal move queries.
         dice (list[int]): Current dice rolled.
-        rng (random.Random): Random number generator for dice rolls.
+        rng (random.Random): Random number generator; seeds the dice generator.
     """
 
+    __slots__ = (
+        "players", "state", "rules", "rng", "enable_cube", "cube_value", "cube_owner",
+        "undo", "emit_enabled", "events", "tmgen", "dice",
+        "_dice_rng", "_dice_buf", "_dice_idx", "_legal_moves", "_legal_moves_key",
+    )
+
     def __init__(
         self, 
         player0: Player, 
@@ -155,6 +173,12 @@ class GameEngine:
         self.state: BackgammonState = state
         self.rules: BackgammonRules = rules
         self.rng: random.Random = rng or random.Random()
+
+        # Dice come from a buffer filled in bulk by a NumPy generator seeded
+        # from self.rng, so a seeded rng still gives reproducible games.
+        self._dice_rng: np.random.Generator = np.random.default_rng(self.rng.getrandbits(64))
+        self._dice_buf: list[int] = []
+        self._dice_idx: int = 0
         self.enable_cube: bool = enable_cube
 
         self.cube_value: int = 1
@@ -163,8 +187,12 @@ class GameEngine:
         self.undo: Undo = Undo()
         self.emit_enabled: bool = emit_enabled
         self.events: EngineEvents = EngineEvents()
+        self.tmgen: TurnMoveGenerator = TurnMoveGenerator()
         self.dice: list[int] = []
 
+        self._legal_moves: list = []
+        self._legal_moves_key: Optional[tuple] = None  # (state id, state version, dice)
+
     # ---------- Properties ----------
     @property
     def turn(self) -> int:
@@ -178,19 +206,40 @@ class GameEngine:
 
     @property
     def legal_moves(self) -> list:
-        """Return list of legal turn moves for the current dice and state."""
-        return TurnMoveGenerator().generate_legal_moves(self.state, self.rules, self.dice)
+        """
+        Return list of legal turn moves for the current dice and state.
+
+        The list is cached until the state (tracked via its version counter)
+        or the dice change, so repeated reads within a turn are free.
+        """
+        key = (id(self.state), self.state.version, tuple(self.dice))
+        if key != self._legal_moves_key:
+            self._legal_moves = self.tmgen.generate_legal_moves(self.state, self.rules, self.dice)
+            self._legal_moves_key = key
+        return self._legal_moves
 
     def get_player_type(self, player: int) -> str:
         """Return string representation of a player."""
         return str(self.players[player])
 
     # ---------- Dice ----------
+    def _next_die(self) -> int:
+        """Return the next die value (1-6) from the buffer, refilling it when drained."""
+        if self._dice_idx >= len(self._dice_buf):
+            self._dice_buf = self._dice_rng.integers(1, 7, DICE_BUFFER_SIZE, dtype=np.int8).tolist()
+            self._dice_idx = 0
+        die = self._dice_buf[self._dice_idx]
+        self._dice_idx += 1
+        return die
+
     def roll_start_dice(self) -> tuple[int, int]:
-        """Roll dice to determine which player starts. Re-roll doubles."""
-        d0, d1 = self.rng.randint(1, 6), self.rng.randint(1, 6)
-        while d0 == d1:
-            d0, d1 = self.rng.randint(1, 6), self.rng.randint(1, 6)
+        """Roll dice to determine which player starts (never a double)."""
+        # Draw the second die from the five values other than d0 instead of
+        # re-rolling doubles; uniform over all ordered non-equal pairs.
+        d0 = self._next_die()
+        d1 = int(self._dice_rng.integers(1, 6))
+        if d1 >= d0:
+            d1 += 1
         start_turn = 0 if d0 > d1 else 1
         if self.turn != start_turn:
             self.state.switch_turn()
@@ -198,7 +247,7 @@ class GameEngine:
 
     def roll_dice(self) -> None:
         """Roll dice for a turn and expand doubles if needed."""
-        d1, d2 = self.rng.randint(1, 6), self.rng.randint(1, 6)
+        d1, d2 = self._next_die(), self._next_die()
         self.dice = self.rules.process_dice([d1, d2])
 
     # ---------- Turn Management ----------
@@ -221,13 +270,13 @@ class GameEngine:
         turn = self.turn
 
         if self.cube_owner not in (None, turn):
-            return CubeDecision(False, None, None)
+            return _NO_OFFER
 
         player = self.players[turn]
         opponent = self.players[1 - turn]
 
         if not player.offer_double(self.cube_value, self.state):
-            return CubeDecision(False, None, None)
+            return _NO_OFFER
 
         if not opponent.accept_double(self.cube_value, self.state):
             game_result = GameResult(
@@ -248,17 +297,12 @@ class GameEngine:
         """Undo the last move and return it."""
         return self.undo.undo_last_move(self.state)
 
-    # ---------- Event Emission ----------
-    def emit(self, event: dict) -> Any:
-        """Yield an event if emission is enabled."""
-        if self.emit_enabled:
-            yield event
-
     # ---------- Internal Phases ----------
     def _cube_phase(self) -> Optional[GameResult]:
         """Handle doubling cube phase at the start of a turn."""
         decision = self.offer_double()
-        yield from self.emit(self.events.cube_action(self.turn, decision, self.cube_value))
+        if self.emit_enabled:
+            yield self.events.cube_action(self.turn, decision, self.cube_value)
 
         if decision.offered and not decision.accepted:
             return decision.result
@@ -267,19 +311,23 @@ class GameEngine:
 
     def _play_turn_moves(self, player: Player, dice: list[int], stepwise: bool):
         """Apply all legal moves for a turn, emitting events if stepwise."""
-        if not self.legal_moves:
-            yield from self.emit(self.events.no_moves(self.turn))
+        emit = self.emit_enabled
+        moves = self.legal_moves
+        if not moves:
+            if emit:
+                yield self.events.no_moves(self.turn)
             return
 
-        turn_move = self.player.select_move(self.legal_moves, self.state.copy(), self.dice)
-        yield from self.emit(self.events.chosen_move(self.turn, turn_move))
+        state_arg = self.state.copy() if player.needs_state_copy else self.state
+        turn_move = player.select_move(moves, state_arg, self.dice)
+        if emit:
+            yield self.events.chosen_move(self.turn, turn_move)
 
         for smove in turn_move:
             self.state.apply_move(smove)
-            if hasattr(self, "undo"):
-                self.undo.record_move(smove)
-            if stepwise:
-                yield from self.emit(self.events.apply_move(smove, self.state))
+            self.undo.record_move(smove)
+            if stepwise and emit:
+                yield self.events.apply_move(smove, self.state)
 
     # ---------- Game Loop ----------
     def play_from_state(self, stepwise: bool = True, max_turns: Optional[int] = None):
@@ -293,6 +341,7 @@ class GameEngine:
         Yields:
             dict: Engine events describing the game progression.
         """
+        emit = self.emit_enabled
         game_result = self.game_finished()
         turns_played = 0
 
@@ -301,32 +350,36 @@ class GameEngine:
                 break
 
             player = self.players[self.turn]
-            bear_off_allowed = self.rules.bearing_off_allowed(self.state)
 
-            yield from self.emit(self.events.turn_start(self.turn, self.state, bear_off_allowed))
+            if emit:
+                bear_off_allowed = self.rules.bearing_off_allowed(self.state)
+                yield self.events.turn_start(self.turn, self.state, bear_off_allowed)
 
-            if self.enable_cube:
+            # Only the cube owner (or anyone while it is centered) can double
+            if self.enable_cube and self.cube_owner in (None, self.turn):
                 cube_result = yield from self._cube_phase()
                 if cube_result:
                     game_result = cube_result
                     break
 
             self.roll_dice()
-            yield from self.emit(self.events.roll_dice(self.dice, self.turn, self.get_player_type(self.turn)))
+            if emit:
+                yield self.events.roll_dice(self.dice, self.turn, self.get_player_type(self.turn))
 
             yield from self._play_turn_moves(player, self.dice, stepwise)
 
-            yield from self.emit(self.events.turn_end(1 - self.turn, self.state))
+            if emit:
+                yield self.events.turn_end(1 - self.turn, self.state)
 
             self.next_turn()
             turns_played += 1
             game_result = self.game_finished()
 
-        if game_result:
+        if game_result and emit:
             winner, points, cube_value, result_type = game_result
-            yield from self.emit(self.events.game_over(
+            yield self.events.game_over(
                 self.state, winner, self.get_player_type(winner), points, self.cube_value, result_type
-            ))
+            )
 
     def play_game(self, stepwise: bool = True):
         """
@@ -339,5 +392,6 @@ class GameEngine:
             dict: Engine events describing the game progression.
         """
         d0, d1 = self.roll_start_dice()
-        yield from self.emit(self.events.start_roll((d0, d1), self.turn))
+        if self.emit_enabled:
+            yield self.events.start_roll((d0, d1), self.turn)
         yield from self.play_from_state(stepwise=stepwise)
@@ -2,74 +2,119 @@
 # --- core_generator.py ---
 # =========================================================
 
+from array import array
 from typing import List, Optional, Iterator, Tuple, Dict
 
-from .board import DIRECTION, BEAR_OFF_ANCHOR
+from .board import BOARD_START, BOARD_END, BEAR_OFF_ANCHOR
 from .moves import SingleMoveType, SingleMove, TurnMove
 from .state import BackgammonState
 from .rules import BackgammonRules
 
-from utils.bitmask import indices_from_bits, is_bit_set
+from utils.bitmask import is_bit_set
 
 # =========================================================
 
 class SingleMovesGenerator:
     """Generates legal single moves for a given die and state."""
 
-    def generate_moves(self, die: int, rules: BackgammonRules, state: BackgammonState) -> List[SingleMove]:
+    def generate_moves(
+        self,
+        die: int,
+        rules: BackgammonRules,
+        state: BackgammonState,
+        mask_cache: Optional[Dict[Tuple[int, int, int], int]] = None,
+        bear_off_cache: Optional[Dict[Tuple[int, int], bool]] = None,
+    ) -> List[SingleMove]:
         """
         Generate all legal single moves for the current player with a given die.
 
+        Everything that does not depend on the start point (target mask, hittable
+        points, bear-off eligibility) is evaluated once per die; the loop over the
+        start points only does bit tests.
+
         Args:
             die: The die value to move.
             rules: Game rules engine.
             state: Current game state.
+            mask_cache: Optional legal target masks keyed by (hash, die, turn),
+                shared across the calls of one turn generation.
+            bear_off_cache: Optional bear-off eligibility keyed by (hash, turn),
+                shared the same way.
 
         Returns:
             List of legal SingleMove instances.
         """
         single_moves: List[SingleMove] = []
-        
-        for start in indices_from_bits(rules.allowed_start_points_mask(state)):
-            smove = self._single_move(start, die, rules, state)
-            if smove is not None:
-                single_moves.append(smove)
-      
+
+        player = state.turn
+        step = die * state._dir_turn
+        if mask_cache is None:
+            legal_mask = rules.generate_legal_mask(state, die)
+        else:
+            key = (state.zobrist_hash, die, player)
+            legal_mask = mask_cache.get(key)
+            if legal_mask is None:
+                legal_mask = mask_cache[key] = rules.generate_legal_mask(state, die)
+        hit_mask = state.hittable_mask()
+        bear_off_ok: Optional[bool] = None  # evaluated lazily, only needed for stones leaving the board
+
+        # Peel the start points off the mask lowest bit first (no index list)
+        starts = rules.allowed_start_points_mask(state)
+        while starts:
+            lsb = starts & -starts
+            starts ^= lsb
+            start = lsb.bit_length() - 1
+            target = start + step
+
+            if BOARD_START <= target <= BOARD_END:
+                if is_bit_set(target, legal_mask):
+                    mtype = SingleMoveType.HIT if is_bit_set(target, hit_mask) else SingleMoveType.NORMAL
+                    single_moves.append(SingleMove(player, start, target, mtype, die))
+                continue
+
+            # Check for bearing off
+            if bear_off_ok is None:
+                if bear_off_cache is None:
+                    bear_off_ok = rules.bearing_off_allowed(state)
+                else:
+                    key = (state.zobrist_hash, player)
+                    bear_off_ok = bear_off_cache.get(key)
+                    if bear_off_ok is None:
+                        bear_off_ok = bear_off_cache[key] = rules.bearing_off_allowed(state)
+            if bear_off_ok and rules.bear_off_target(state, start, target, die):
+                single_moves.append(SingleMove(player, start, BEAR_OFF_ANCHOR[player], SingleMoveType.BEAR_OFF, die))
+
         return single_moves
 
-    def _single_move(self, start: int, die: int, rules: BackgammonRules, state: BackgammonState) -> Optional[SingleMove]:
-        """
-        Generate a single legal move from a given start point using a die.
 
-        Args:
-            start: Starting point of the move.
-            die: Die value to use.
-            rules: Game rules engine.
-            state: Current game state.
+#: Shared stateless generator used by the turn DFS.
+_SINGLE_MOVES = SingleMovesGenerator()
 
-        Returns:
-            A SingleMove if legal, otherwise None.
-        """
-        target = start + die * DIRECTION[state.turn]
-        
-        if state.is_on_board(target):
-            legal_mask = rules.generate_legal_mask(state, die)
-            if is_bit_set(target, legal_mask):
-                mtype = SingleMoveType.HIT if rules.hittable_target(state, target) else SingleMoveType.NORMAL
-                return SingleMove(state.turn, start, target, mtype, die)
-        
-        # Check for bearing off
-        if rules.bearing_off_allowed(state):
-            if rules.bear_off_target(state, start, target, die):
-                return SingleMove(state.turn, start, BEAR_OFF_ANCHOR[state.turn], SingleMoveType.BEAR_OFF, die)
-        
-        return None
+#: Upper bound on single moves in one turn (doubles).
+_MAX_TURN_DEPTH = 4
+
+#: Bit width of one per-face dice counter in a dice key (counts never exceed 4).
+_DICE_KEY_BITS = 4
+
+#: Total width of a dice key (six faces), the hash is shifted above it.
+_DICE_KEY_WIDTH = 6 * _DICE_KEY_BITS
+
+
+def _die_key(die: int) -> int:
+    """Return the dice-key contribution of a single die."""
+    return 1 << (_DICE_KEY_BITS * (die - 1))
 
 
 class TurnMoveGenerator:
     """Generates legal sequences of moves (TurnMove) for a given dice roll."""
 
-    def any_move_left(self, state: BackgammonState, rules: BackgammonRules, dice: List[int]) -> bool:
+    def any_move_left(
+        self,
+        state: BackgammonState,
+        rules: BackgammonRules,
+        dice: List[int],
+        mask_cache: Optional[Dict[Tuple[int, int, int], int]] = None,
+    ) -> bool:
         """
         Check if any legal move is possible for the current player with remaining dice.
 
@@ -77,6 +122,7 @@ class TurnMoveGenerator:
             state: Current game state.
             rules: Game rules engine.
             dice: List of remaining dice.
+            mask_cache: Optional legal mask cache, see SingleMovesGenerator.generate_moves.
 
         Returns:
             True if at least one move is possible, False otherwise.
@@ -85,7 +131,7 @@ class TurnMoveGenerator:
             return False
                      
         for die in set(dice):
-            single_moves = SingleMovesGenerator().generate_moves(die, rules, state)
+            single_moves = _SINGLE_MOVES.generate_moves(die, rules, state, mask_cache)
             if single_moves:
                 return True
         
@@ -104,31 +150,47 @@ class TurnMoveGenerator:
             List of TurnMove sequences.
         """
         turn_moves: List[TurnMove] = []
-        visited_states: set[Tuple[int, Tuple[int, ...]]] = set()
-
-        def dfs(state: BackgammonState, dice_left: List[int], path: List[SingleMove]) -> None:
-            if not self.any_move_left(state, rules, dice_left):
-                if path:
-                    turn_moves.append(TurnMove(single_moves=path))
+        visited_states: set[int] = set()
+        path_buf: List[Optional[SingleMove]] = [None] * _MAX_TURN_DEPTH
+        # Rule results per position, fresh for every call
+        legal_masks: Dict[Tuple[int, int, int], int] = {}
+        bear_off_flags: Dict[Tuple[int, int], bool] = {}
+
+        # Make/unmake traversal: the board, the remaining dice and the current
+        # path are all mutated in place and restored after each child.
+        # Memo key: Zobrist hash (includes the turn) shifted above an
+        # order-independent dice key holding one counter per die face.
+        # The dice key is updated by subtraction, no sorting per node.
+        def dfs(dice_left: List[int], dice_key: int, depth: int) -> None:
+            # Moves per distinct die, reused both for the leaf test and the expansion
+            by_die = {die: _SINGLE_MOVES.generate_moves(die, rules, state, legal_masks, bear_off_flags)
+                      for die in set(dice_left)}
+            if not any(by_die.values()):
+                if depth:
+                    turn_moves.append(TurnMove(single_moves=tuple(path_buf[:depth])))
                 return
 
-            state_hash = (hash(state), tuple(sorted(dice_left)))
-            if state_hash in visited_states:
+            node_key = (state.zobrist_hash << _DICE_KEY_WIDTH) | dice_key
+            if node_key in visited_states:
                 return
-            visited_states.add(state_hash)
+            visited_states.add(node_key)
 
-            for idx, die in enumerate(dice_left):
-                single_moves = SingleMovesGenerator().generate_moves(die, rules, state)
+            for idx in range(len(dice_left)):
+                die = dice_left[idx]
+                single_moves = by_die[die]
                 if not single_moves:
                     continue
 
-                remaining = dice_left[:idx] + dice_left[idx+1:]
+                dice_left.pop(idx)
+                child_key = dice_key - _die_key(die)
                 for smove in single_moves:
+                    path_buf[depth] = smove
                     state.apply_move(smove)
-                    dfs(state, remaining, path + [smove])
+                    dfs(dice_left, child_key, depth + 1)
                     state.undo_move(smove)
+                dice_left.insert(idx, die)
 
-        dfs(state, dice, [])
+        dfs(list(dice), sum(_die_key(die) for die in dice), 0)
         return turn_moves
 
     def generate_legal_moves(self, state: BackgammonState, rules: BackgammonRules, dice: List[int]) -> List[TurnMove]:
@@ -155,10 +217,20 @@ class MoveTree:
         """
         Build a move tree from a list of TurnMove sequences.
 
+        Besides the nested dict in root (used for interactive navigation), the
+        tree is flattened into an arena of parallel lists: node 0 is the root,
+        and each node stores its move, its first child and its next sibling
+        (-1 = none). Iteration walks these indices instead of the dicts.
+
         Args:
             turn_moves: List of TurnMove sequences to build the tree.
         """
         self.root: Dict[SingleMove, Dict] = self._build_tree([tmove.single_moves for tmove in turn_moves])
+
+        self._moves: List[Optional[SingleMove]] = [None]
+        self._first_child: array = array('i', [-1])
+        self._next_sibling: array = array('i', [-1])
+        self._flatten(self.root, 0)
     
     def __repr__(self) -> str:
         return f"<MoveTree root_moves={len(self.root)}>"
@@ -173,25 +245,42 @@ class MoveTree:
         Returns:
             Nested dictionary representing the move tree.
         """
-        smove_tree: Dict[SingleMove, Dict] = {}
-        if not sequences or len(sequences[0]) == 0:
-            return smove_tree
+        # Group the tails by their head move in one pass; dicts keep
+        # insertion order, so the enumeration order of the tree is stable.
+        groups: Dict[SingleMove, List[List[SingleMove]]] = {}
+        for smove_seq in sequences:
+            if smove_seq:
+                groups.setdefault(smove_seq[0], []).append(smove_seq[1:])
 
-        remaining: Dict[SingleMove, List[List[SingleMove]]] = {}
-        seen: set[SingleMove] = set()
+        return {smove: self._build_tree(sub_seqs) for smove, sub_seqs in groups.items()}
 
-        for smove_seq in sequences:
-            smove = smove_seq[0]
-            if smove not in seen:
-                smove_tree[smove] = {}
-                remaining[smove] = []
-                seen.add(smove)
-            remaining[smove].append(smove_seq[1:])
+    def _flatten(self, tree: Dict[SingleMove, Dict], parent: int) -> None:
+        """
+        Append the children of a dict node to the arena, keeping their order.
 
-        for smove, sub_seqs in remaining.items():
-            smove_tree[smove] = self._build_tree(sub_seqs)
+        Args:
+            tree: Dict subtree whose entries become children of parent.
+            parent: Arena index of the node the entries belong to.
+        """
+        prev = -1
+        for smove, subtree in tree.items():
+            idx = len(self._moves)
+            self._moves.append(smove)
+            self._first_child.append(-1)
+            self._next_sibling.append(-1)
+            if prev < 0:
+                self._first_child[parent] = idx
+            else:
+                self._next_sibling[prev] = idx
+            prev = idx
+            self._flatten(subtree, idx)
 
-        return smove_tree
+    def _children(self, idx: int) -> Iterator[int]:
+        """Yield the arena indices of the children of a node."""
+        child = self._first_child[idx]
+        while child >= 0:
+            yield child
+            child = self._next_sibling[child]
 
     def iter_paths(self) -> Iterator[List[SingleMove]]:
         """
@@ -200,13 +289,18 @@ class MoveTree:
         Yields:
             Lists of SingleMove representing each path from root to leaf.
         """
-        def _iter(tree: Dict[SingleMove, Dict], path: List[SingleMove]) -> Iterator[List[SingleMove]]:
-            if not tree:
-                yield path
-            for node, subtree in tree.items():
-                yield from _iter(subtree, path + [node])
+        moves, path = self._moves, []
+
+        def _iter(idx: int) -> Iterator[List[SingleMove]]:
+            if self._first_child[idx] < 0:
+                yield list(path)
+                return
+            for child in self._children(idx):
+                path.append(moves[child])
+                yield from _iter(child)
+                path.pop()
 
-        return _iter(self.root, [])
+        return _iter(0)
 
     def iter_paths_stepwise(self) -> Iterator[Tuple[List[SingleMove], List[SingleMove]]]:
         """
@@ -217,16 +311,17 @@ class MoveTree:
                 - path: current path taken
                 - options: next possible SingleMove options from the current node
         """
-        def _gen(tree: Dict[SingleMove, Dict], path: List[SingleMove]) -> Iterator[Tuple[List[SingleMove], List[SingleMove]]]:
-            if not tree:
-                yield path, []
-            else:
-                options = list(tree.keys())
-                yield path, options
-                for node, subtree in tree.items():
-                    yield from _gen(subtree, path + [node])
+        moves, path = self._moves, []
 
-        return _gen(self.root, [])
+        def _gen(idx: int) -> Iterator[Tuple[List[SingleMove], List[SingleMove]]]:
+            children = list(self._children(idx))
+            yield list(path), [moves[child] for child in children]
+            for child in children:
+                path.append(moves[child])
+                yield from _gen(child)
+                path.pop()
+
+        return _gen(0)
 
     def __str__(self) -> str:
         """
@@ -235,11 +330,12 @@ class MoveTree:
         Returns:
             Multi-line string showing the tree hierarchy.
         """
-        def _str(tree: Dict[SingleMove, Dict], prefix: str = "") -> List[str]:
-            lines: List[str] = []
-            for node, subtree in tree.items():
-                lines.append(prefix + str(node))
-                lines.extend(_str(subtree, prefix + " " * 8))
-            return lines
+        lines: List[str] = []
+
+        def _str(idx: int, prefix: str) -> None:
+            for child in self._children(idx):
+                lines.append(prefix + str(self._moves[child]))
+                _str(child, prefix + " " * 8)
 
-        return "\n".join(_str(self.root))
+        _str(0, "")
+        return "\n".join(lines)
@@ -2,9 +2,9 @@
 # --- core_moves.py ---
 # =========================================================
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Iterator, List, Tuple
+from typing import Iterator, NamedTuple, Tuple
 
 # =========================================================
 
@@ -22,11 +22,14 @@ class SingleMoveType(Enum):
     BEAR_OFF = 3
 
 
-@dataclass(frozen=True)
-class SingleMove:
+class SingleMove(NamedTuple):
     """
     Represents a single atomic move in Backgammon.
 
+    A NamedTuple rather than a frozen dataclass: the generator creates one per
+    candidate move, and tuple construction, field access and hashing all run
+    in C (no per-field object.__setattr__).
+
     Attributes:
         player (int): The player making the move (0 or 1).
         from_point (int): Starting point index of the move.
@@ -49,15 +52,28 @@ class SingleMove:
         return str(self)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TurnMove:
     """
     Represents a full turn consisting of one or more single moves.
 
+    Hashable; the hash is computed once on construction.
+
     Attributes:
-        single_moves (List[SingleMove]): Ordered list of single moves executed during the turn.
+        single_moves (Tuple[SingleMove, ...]): Ordered single moves executed during the turn.
+            Lists passed in are converted to a tuple.
     """
-    single_moves: List[SingleMove]
+    single_moves: Tuple[SingleMove, ...]
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.single_moves, tuple):
+            object.__setattr__(self, "single_moves", tuple(self.single_moves))
+        object.__setattr__(self, "_hash", hash(self.single_moves))
+
+    def __hash__(self) -> int:
+        """Return the precomputed hash of the move sequence."""
+        return self._hash
 
     def __iter__(self) -> Iterator[SingleMove]:
         """
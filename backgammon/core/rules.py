@@ -2,14 +2,13 @@
 # --- core_rules.py ---
 # =========================================================
 
-from typing import List, Optional, Union
-from dataclasses import dataclass
+from typing import List, NamedTuple, Optional, Union
 
-from .board import BOARD_START, BOARD_END, BAR_FIELD, HOME_START, HOME_END, HOME_MASK, OUTSIDE_HOME_MASK, FULL_BOARD_MASK, BEAR_OFF_ANCHOR, DIRECTION, NUM_OF_ALL_STONES
+from .board import BOARD_START, BOARD_END, BAR_FIELD, HOME_START, HOME_END, HOME_MASK, OUTSIDE_HOME_MASK, FULL_BOARD_MASK, BEAR_OFF_ANCHOR, DIRECTION
 from .moves import SingleMoveType, SingleMove, TurnMove
 from .state import BackgammonState
 
-from utils.bitmask import set_bit, remove_from_mask, set_all_bits, shift_mask
+from utils.bitmask import set_all_bits
 
 # =========================================================
 
@@ -46,6 +45,10 @@ class Rule:
 
 # --- Specific Rules ---
 
+#: Bar bit per player (bit of BAR_FIELD[player])
+BAR_BIT = (1 << BAR_FIELD[0], 1 << BAR_FIELD[1])
+
+
 class BarPriorityRule(Rule):
     """R1: Player must re-enter stones from the bar first."""
 
@@ -62,10 +65,10 @@ class BarPriorityRule(Rule):
         Returns:
             Bitmask representing positions that must be entered or occupied.
         """
-        bar_index = BAR_FIELD[state.turn]
-        if state.num_of_stones(bar_index, state.turn) > 0:
-            return set_bit(bar_index)
-        return state.masks['occupied']
+        # The bar is tracked in the occupancy mask like any other point
+        bar_bit = state._bar_bit_turn
+        occ = state.occ_mask()
+        return bar_bit if occ & bar_bit else occ
 
 
 class BearingOffEligibilityRule(Rule):
@@ -85,7 +88,21 @@ class BearingOffEligibilityRule(Rule):
             True if bearing off is allowed, False otherwise.
         """
         outside_home = OUTSIDE_HOME_MASK[state.turn]
-        return (outside_home & state.masks['occupied']) == 0
+        return (outside_home & state.occ_mask()) == 0
+
+
+#: Home points "behind" a start point, per player and start (0-25): the home
+#: points further from bear-off than start, which must be empty for an overshoot.
+BEHIND_MASK = (
+    tuple(HOME_MASK[0] & ~set_all_bits(HOME_START[0], start) for start in range(26)),
+    tuple(HOME_MASK[1] & ~set_all_bits(start, HOME_END[1]) for start in range(26)),
+)
+
+#: Home point that bears off exactly with a die, per player and die (index 0 unused).
+EXACT_HOME_POINT = (
+    tuple(BEAR_OFF_ANCHOR[0] - die * DIRECTION[0] for die in range(7)),
+    tuple(BEAR_OFF_ANCHOR[1] - die * DIRECTION[1] for die in range(7)),
+)
 
 
 class BearOffTargetRule(Rule):
@@ -96,16 +113,7 @@ class BearOffTargetRule(Rule):
 
     def _no_stone_behind(self, start: int, state: BackgammonState) -> bool:
         """Check if there are no stones behind the start position."""
-        player = state.turn
-        home_mask = HOME_MASK[player]
-        home_start, home_end = HOME_START[player], HOME_END[player]
-
-        if player == 0:
-            mask_behind = remove_from_mask(home_mask, set_all_bits(home_start, start))
-        else:
-            mask_behind = remove_from_mask(home_mask, set_all_bits(start, home_end))
-
-        return (state.masks['occupied'] & mask_behind) == 0
+        return (state.occ_mask() & BEHIND_MASK[state.turn][start]) == 0
 
     def check(self, state: BackgammonState, start: int, target: int, die: int, **kwargs) -> bool:
         """
@@ -132,11 +140,10 @@ class BearOffTargetRule(Rule):
 
         if overshoot:
             if self._no_stone_behind(start, state):
-                for p in range(HOME_START[player], HOME_END[player] + 1):
-                    if state.num_of_stones(p, player) > 0:
-                        exact = p + die * DIRECTION[player]
-                        if exact == BEAR_OFF_ANCHOR[player]:
-                            return False
+                # No overshoot while a stone could bear off exactly with this die
+                exact_point = EXACT_HOME_POINT[player][die]
+                if HOME_START[player] <= exact_point <= HOME_END[player]:
+                    return state.num_of_stones(exact_point, player) == 0
                 return True
 
         return False
@@ -159,7 +166,29 @@ class SingleHitRule(Rule):
         Returns:
             True if the point can be hit, False otherwise.
         """
-        return state.num_of_stones(point, state.opp) == 1
+        # Opponent occupies the point but holds no pair there
+        return (state.hittable_mask() >> point) & 1 == 1
+
+
+def legal_mask_kernel(occ: int, blocked: int, turn: int, die: int) -> int:
+    """
+    Compute the legal target mask from plain int masks.
+
+    Bar priority (R1) is folded in: while the bar bit is set in occ, only the bar moves.
+
+    Args:
+        occ: Occupancy mask of the active player (includes the bar bit).
+        blocked: Points blocked for the active player.
+        turn: Active player (0 or 1).
+        die: Die value.
+
+    Returns:
+        Bitmask of legal target points.
+    """
+    bar_bit = BAR_BIT[turn]
+    sm = bar_bit if occ & bar_bit else occ
+    shifted = sm >> die if turn == 0 else sm << die
+    return shifted & FULL_BOARD_MASK & ~blocked
 
 
 class LegalMaskRule(Rule):
@@ -179,11 +208,8 @@ class LegalMaskRule(Rule):
         Returns:
             Bitmask of legal target points.
         """
-        sm = BarPriorityRule().check(state)
-        shifted = shift_mask(sm, die * DIRECTION[state.turn])
-        shifted &= FULL_BOARD_MASK
-        legal_mask = remove_from_mask(shifted, state.masks['blocked'])
-        return legal_mask
+        turn = state.turn
+        return legal_mask_kernel(state._occ_mask[turn], state._blocked_mask[turn], turn, die)
 
 
 class DiceHelperRule(Rule):
@@ -225,23 +251,25 @@ class FilterTurnMovesRule(Rule):
         Returns:
             Filtered list of TurnMoves.
         """
-        if not turn_moves:
-            return []
-
-        max_len = max(len(tmove) for tmove in turn_moves)
-        turn_moves = [tmove for tmove in turn_moves if len(tmove) == max_len]
+        max_len = 0
+        best: List[TurnMove] = []
+        for tmove in turn_moves:
+            length = len(tmove.single_moves)
+            if length > max_len:
+                max_len = length
+                best = [tmove]
+            elif length == max_len:
+                best.append(tmove)
 
         if max_len == 1:
-            dice_set = set(smove.die for tmove in turn_moves for smove in tmove)
-            big = max(dice_set)
-            turn_moves = [tmove for tmove in turn_moves
-                          if tmove.single_moves and tmove.single_moves[0].die == big]
+            # Every remaining sequence holds exactly one move
+            big = max(tmove.single_moves[0].die for tmove in best)
+            best = [tmove for tmove in best if tmove.single_moves[0].die == big]
 
-        return turn_moves
+        return best
 
 
-@dataclass(frozen=True)
-class GameResult:
+class GameResult(NamedTuple):
     """Encapsulates the outcome of a completed game."""
 
     winner: int
@@ -267,44 +295,49 @@ class GameOverRule(Rule):
         Returns:
             GameResult if the game is over, None otherwise.
         """
-        for player in (0, 1):
-            if state.bear_off_stones[player] == NUM_OF_ALL_STONES[player]:
-                opponent = 1 - player
+        done = state._all_borne_off
+        if not done:
+            return None
+
+        player = 0 if done & 1 else 1
+        opponent = 1 - player
+
+        if state.bear_off_stones[opponent] != 0:
+            return GameResult(player, cube_value, cube_value, "WIN")
 
-                gammon = (state.bear_off_stones[opponent] == 0)
-                occ = state._occ_mask[opponent]
-                additional = (state.num_of_stones(BAR_FIELD[opponent], opponent) > 0 or (occ & HOME_MASK[player] != 0))
-                backgammon = gammon & additional
+        # Only the opponent's own stones can sit on its bar point
+        on_bar = state._counts[opponent][BAR_FIELD[opponent]] != 0
+        if on_bar or state._occ_mask[opponent] & HOME_MASK[player]:
+            return GameResult(player, 3 * cube_value, cube_value, "BACKGAMMON")
+        return GameResult(player, 2 * cube_value, cube_value, "GAMMON")
 
-                if backgammon:
-                    mult = 3
-                    kind = "BACKGAMMON"
-                elif gammon:
-                    mult = 2
-                    kind = "GAMMON"
-                else:
-                    mult = 1
-                    kind = "WIN"
 
-                points = mult * cube_value
-                return GameResult(player, points, cube_value, kind)
+# --- Rule singletons ---
+# Rules hold no per-game state, so every BackgammonRules shares these instances.
 
-        return None
+_R1 = BarPriorityRule()
+_R2 = BearingOffEligibilityRule()
+_R3 = BearOffTargetRule()
+_R4 = SingleHitRule()
+_R5 = LegalMaskRule()
+_R6 = DiceHelperRule()
+_R7 = FilterTurnMovesRule()
+_R8 = GameOverRule()
 
 
 class BackgammonRules:
     """Aggregates all rules and provides a convenient interface for game logic."""
 
     def __init__(self) -> None:
-        """Initialize all rule instances."""
-        self.R1 = BarPriorityRule()
-        self.R2 = BearingOffEligibilityRule()
-        self.R3 = BearOffTargetRule()
-        self.R4 = SingleHitRule()
-        self.R5 = LegalMaskRule()
-        self.R6 = DiceHelperRule()
-        self.R7 = FilterTurnMovesRule()
-        self.R8 = GameOverRule()
+        """Bind the shared rule instances."""
+        self.R1 = _R1
+        self.R2 = _R2
+        self.R3 = _R3
+        self.R4 = _R4
+        self.R5 = _R5
+        self.R6 = _R6
+        self.R7 = _R7
+        self.R8 = _R8
 
         self.rules = [self.R1, self.R2, self.R3, self.R4, self.R5, self.R6, self.R7, self.R8]
 
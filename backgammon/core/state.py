@@ -4,14 +4,15 @@
 
 import numpy as np
 import random
-import copy
 from typing import Optional, List, Dict, Any, Tuple
 
-from .board import BOARD_START, BOARD_END, BAR_FIELD, STONE, NUM_OF_ALL_STONES, DEFAULT_POSITIONS
+from .board import BOARD_START, BOARD_END, BAR_FIELD, STONE, DIRECTION, NUM_OF_ALL_STONES, DEFAULT_POSITIONS
 from .moves import SingleMoveType, SingleMove
 from .state_invariants import assert_state_invariant
 
-from utils.bitmask import remove_from_mask, bits_from_indices, set_bit, clear_bit  
+#: Saved position: board, bear-off counts, per-player counts, occupancy and
+#: blocked masks, bear-off flags and Zobrist hash (see BackgammonState.snapshot).
+PositionSnapshot = Tuple[np.ndarray, np.ndarray, Tuple[List[int], List[int]], Tuple[int, int], Tuple[int, int], int, int]
 
 # =========================================================
 
@@ -23,15 +24,49 @@ class BackgammonMovesMixin:
     """
 
     def move_stone(self, start: int, target: int, player: int) -> None:
-        """Move a stone from start to target for the given player."""
-        self._remove_stone(start, player)
-        self._add_stone(target, player)
-        self._assert("_move_stone")
+        """
+        Move a stone from start to target for the given player.
+
+        Fuses _remove_stone and _add_stone into a single frame: counts, board,
+        masks and hash are updated with locals and written back once.
+        """
+        counts = self._counts[player]
+        stone = STONE[player]
+        board = self.board
+        occ = self._occ_mask
+        blocked = self._blocked_mask
+        opp = 1 - player
+        base = player << 4
+        h = self.zobrist_hash
+
+        count = counts[start]
+        if count:
+            board[start] -= stone
+            counts[start] = count - 1
+            slot = (start << 5) | base
+            h ^= ZOBRIST_TABLE[slot | count] ^ ZOBRIST_TABLE[slot | (count - 1)]
+            bit = 1 << start
+            if count == 1:
+                occ[player] &= ~bit
+            if count <= 2:
+                blocked[opp] &= ~bit
+
+        count = counts[target]
+        board[target] += stone
+        counts[target] = count + 1
+        slot = (target << 5) | base
+        h ^= ZOBRIST_TABLE[slot | count] ^ ZOBRIST_TABLE[slot | (count + 1)]
+        bit = 1 << target
+        occ[player] |= bit
+        if count >= 1:
+            blocked[opp] |= bit
+
+        self.zobrist_hash = h
+        self.version += 1
 
     def undo_stone_move(self, start: int, target: int, player: int) -> None:
         """Undo a previously executed stone move."""
         self.move_stone(target, start, player)
-        self._assert("_undo_stone_move")
 
     def hit_stone(self, start: int, target: int, player: int) -> None:
         """Hit opponent's stone at target and move player's stone there."""
@@ -51,20 +86,23 @@ class BackgammonMovesMixin:
         self._remove_stone(point, player)
         self.bear_off_stones[player] += 1
         new_count = self.bear_off_stones[player]
+        if new_count == NUM_OF_ALL_STONES[player]:
+            self._all_borne_off |= 1 << player
 
-        self.zobrist_hash ^= ZOBRIST_TABLE[26 + player][player][old_count]
-        self.zobrist_hash ^= ZOBRIST_TABLE[26 + player][player][new_count]
+        self.zobrist_hash ^= ZOBRIST_TABLE[((26 + player) << 5) | (player << 4) | int(old_count)]
+        self.zobrist_hash ^= ZOBRIST_TABLE[((26 + player) << 5) | (player << 4) | int(new_count)]
 
     def undo_bear_off(self, point: int, player: int) -> None:
         """Undo a previously executed bear-off move."""
         old_count = self.bear_off_stones[player]
         self.bear_off_stones[player] -= 1
         new_count = self.bear_off_stones[player]
+        self._all_borne_off &= ~(1 << player)
 
         self._add_stone(point, player)
 
-        self.zobrist_hash ^= ZOBRIST_TABLE[26 + player][player][old_count]
-        self.zobrist_hash ^= ZOBRIST_TABLE[26 + player][player][new_count]
+        self.zobrist_hash ^= ZOBRIST_TABLE[((26 + player) << 5) | (player << 4) | int(old_count)]
+        self.zobrist_hash ^= ZOBRIST_TABLE[((26 + player) << 5) | (player << 4) | int(new_count)]
 
     def apply_move(self, move: SingleMove) -> bool:
         """
@@ -84,8 +122,11 @@ class BackgammonMovesMixin:
         elif move.move_type == SingleMoveType.HIT:
             self.hit_stone(move.from_point, move.to_point, move.player)
         elif move.move_type == SingleMoveType.BEAR_OFF:
-            self.bear_off(move.from_point, move.player)  
+            self.bear_off(move.from_point, move.player)
 
+        # Checked once per move rather than per stone primitive; no call when debug is off
+        if self.debug:
+            assert_state_invariant(self, "apply_move")
         return True
 
     def undo_move(self, move: SingleMove) -> None:
@@ -104,15 +145,26 @@ class BackgammonMovesMixin:
         elif move.move_type == SingleMoveType.BEAR_OFF:
             self.undo_bear_off(move.from_point, move.player)
 
+        if self.debug:
+            assert_state_invariant(self, "undo_move")
+
 
 # =========================================================
 # Zobrist hashing initialization
 # =========================================================
 
-ZOBRIST_TABLE = [[[random.getrandbits(64) for _ in range(16)] for _ in range(2)] for _ in range(26)]
-ZOBRIST_TABLE += [[[random.getrandbits(64) for _ in range(16)] for _ in range(2)] for _ in range(2)]
+#: Flat Zobrist keys for (slot, player, count): slots 0-25 are board points,
+#: 26/27 the bear-off trays of player 0/1; counts go up to 15.
+#: Index with zobrist_index(); a tuple of Python ints keeps every XOR a single lookup.
+#: Count 0 maps to key 0, so incremental updates agree with update_zobrist_hash().
+ZOBRIST_TABLE = tuple(random.getrandbits(64) if i & 15 else 0 for i in range(28 * 2 * 16))
 ZOBRIST_PLAYER = [random.getrandbits(64), random.getrandbits(64)]
 
+
+def zobrist_index(slot: int, player: int, count: int) -> int:
+    """Return the ZOBRIST_TABLE index of a (slot, player, count) triple."""
+    return (slot << 5) | (player << 4) | count
+
 # =========================================================
 
 class BackgammonState(BackgammonMovesMixin):
@@ -121,22 +173,39 @@ class BackgammonState(BackgammonMovesMixin):
 
     Attributes:
         board (np.ndarray): Array of 26 integers representing stones on each point.
+        _counts (Tuple[List[int], List[int]]): Per-player stone counts per point as plain ints,
+            read by num_of_stones. Kept in sync by the stone primitives; call _recompute_masks
+            after writing to board directly.
         bear_off_stones (np.ndarray): Array of 2 integers for stones borne off per player.
+        _all_borne_off (int): Bit p is set once player p has borne off all stones.
         _occ_mask (List[int]): Occupancy masks for each player.
         _blocked_mask (List[int]): Blocked masks for each player.
-        turn (int): Current active player (0 or 1).
+        _derived_key (int): (version << 1) | turn the cached hittable/unprotected masks
+            were computed for; -1 when they are stale. The turn is part of the key because
+            callers may assign turn directly.
+        turn (int): Current active player (0 or 1). Change it through set_turn or
+            switch_turn so the per-turn caches below stay in sync.
+        _opp, _stone_turn, _dir_turn, _bar_turn, _bar_bit_turn (int): Opponent index, stone sign,
+            move direction, bar point and bar bit of the active player.
         zobrist_hash (int): Zobrist hash of the current state.
+        version (int): Counter increased on every mutation (cheap change detection).
         debug (bool): Enable state invariant assertions.
     """
 
     def __init__(self, positions: Optional[List[List[Tuple[int,int]]]] = None, start_player: int = 0, debug: bool = False):
         self.debug: bool = debug        
+        self.version: int = 0
         
         self.board: np.ndarray = np.zeros(26, dtype=np.int8)
+        self._counts: Tuple[List[int], List[int]] = ([0] * 26, [0] * 26)
         self.bear_off_stones: np.ndarray = np.zeros(2, dtype=np.int8)
+        self._all_borne_off: int = 0
 
-        self._occ_mask: List[np.uint32] = [np.uint32(0), np.uint32(0)]
-        self._blocked_mask: List[np.uint32] = [np.uint32(0), np.uint32(0)]
+        self._occ_mask: List[int] = [0, 0]
+        self._blocked_mask: List[int] = [0, 0]
+        self._hittable: int = 0
+        self._unprotected: int = 0
+        self._derived_key: int = -1
 
         self.start_game(positions, start_player)
         self.zobrist_hash: int = 0
@@ -144,27 +213,83 @@ class BackgammonState(BackgammonMovesMixin):
     
     # ---------- Setup / Copy ----------
     def copy(self) -> "BackgammonState":
-        """Return a deep copy of the current game state."""
-        new_state = BackgammonState()
-        new_state.board = copy.deepcopy(self.board)
-        new_state.bear_off_stones = copy.deepcopy(self.bear_off_stones)
+        """
+        Return a deep copy of the current game state.
+
+        Fields are copied directly onto a bare instance; the constructor (which
+        sets up and validates a fresh board) is skipped.
+        """
+        new_state = BackgammonState.__new__(BackgammonState)
+        new_state.debug = self.debug
+        new_state.version = self.version
+        new_state.board = self.board.copy()
+        new_state._counts = (self._counts[0].copy(), self._counts[1].copy())
+        new_state.bear_off_stones = self.bear_off_stones.copy()
+        new_state._all_borne_off = self._all_borne_off
         new_state._occ_mask = self._occ_mask.copy()
         new_state._blocked_mask = self._blocked_mask.copy()
         new_state.turn = self.turn
+        new_state._opp = self._opp
+        new_state._stone_turn = self._stone_turn
+        new_state._dir_turn = self._dir_turn
+        new_state._bar_turn = self._bar_turn
+        new_state._bar_bit_turn = self._bar_bit_turn
         new_state.zobrist_hash = self.zobrist_hash
+        new_state._hittable = self._hittable
+        new_state._unprotected = self._unprotected
+        new_state._derived_key = self._derived_key
         return new_state
 
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "BackgammonState":
+        """Route copy.deepcopy through copy(), avoiding the generic per-attribute walk."""
+        return self.copy()
+
+    def snapshot(self) -> PositionSnapshot:
+        """
+        Save the position (everything but the turn) for a later restore().
+
+        Cheaper than undoing a long run of moves one by one: copies of the
+        26-byte board, the bear-off array and the two count lists plus a few ints.
+        """
+        return (
+            self.board.copy(), self.bear_off_stones.copy(),
+            (self._counts[0].copy(), self._counts[1].copy()),
+            tuple(self._occ_mask), tuple(self._blocked_mask),
+            self._all_borne_off, self.zobrist_hash,
+        )
+
+    def restore(self, snap: PositionSnapshot) -> None:
+        """
+        Restore a position saved by snapshot(); the turn is left unchanged.
+
+        Args:
+            snap: Snapshot returned by snapshot().
+        """
+        board, bear_off, counts, occ, blocked, all_borne_off, zobrist_hash = snap
+        np.copyto(self.board, board)
+        np.copyto(self.bear_off_stones, bear_off)
+        self._counts = (counts[0].copy(), counts[1].copy())
+        self._occ_mask[:] = occ
+        self._blocked_mask[:] = blocked
+        self._all_borne_off = all_borne_off
+        self.zobrist_hash = zobrist_hash
+        self._derived_key = -1
+        self.version += 1
+
     def reset_board(self) -> None:
         """Reset the board, masks, and bear-off counters to empty state."""
         self.board[:] = 0
+        self._counts = ([0] * 26, [0] * 26)
         self.bear_off_stones[:] = 0
+        self._all_borne_off = 0
         self._occ_mask[:] = [0, 0]
         self._blocked_mask[:] = [0, 0]
+        self.version += 1
   
     def start_game(self, positions: Optional[List[List[Tuple[int,int]]]] = None, start_player: int = 0) -> None:
         """Initialize a new game with optional starting positions and starting player."""
         self.reset_board()
-        self.turn = start_player
+        self.set_turn(start_player)
         if positions is None:
             positions = DEFAULT_POSITIONS
         self.place_stones_from_list(positions)
@@ -174,17 +299,49 @@ class BackgammonState(BackgammonMovesMixin):
     @property
     def opp(self) -> int:
         """Return opponent player index (0 or 1)."""
-        return 1 - self.turn
+        return self._opp
 
     @property
     def stone_player(self) -> int:
         """Return the stone sign of the active player (+1 or -1)."""
-        return STONE[self.turn]
+        return self._stone_turn
 
     @property
     def stone_opp(self) -> int:
         """Return the stone sign of the opponent (+1 or -1)."""
-        return STONE[self.opp]
+        return -self._stone_turn
+
+    def occ_mask(self) -> int:
+        """Return the mask of points occupied by the active player."""
+        return self._occ_mask[self.turn]
+
+    def blocked_mask(self) -> int:
+        """Return the mask of points blocked for the active player."""
+        return self._blocked_mask[self.turn]
+
+    def _refresh_derived_masks(self) -> None:
+        """Recompute the cached hittable/unprotected masks for the current version and turn."""
+        turn = self.turn
+        self._hittable = self._occ_mask[1 - turn] & ~self._blocked_mask[turn]
+        self._unprotected = self._occ_mask[turn] & ~self._blocked_mask[1 - turn]
+        self._derived_key = (self.version << 1) | turn
+
+    def pair_mask(self, player: int) -> int:
+        """Return the mask of points holding two or more stones of player."""
+        # A pair of player is exactly a point blocked for the opponent
+        return self._blocked_mask[1 - player]
+
+    def hittable_mask(self) -> int:
+        """Return the mask of opponent blots the active player may hit."""
+        if (self.version << 1) | self.turn != self._derived_key:
+            self._refresh_derived_masks()
+        return self._hittable
+
+    def unprotected_mask(self) -> int:
+        """Return the mask of active player stones not protected against the opponent."""
+        if (self.version << 1) | self.turn != self._derived_key:
+            self._refresh_derived_masks()
+        return self._unprotected
 
     @property
     def masks(self) -> Dict[str, int]:
@@ -194,14 +351,29 @@ class BackgammonState(BackgammonMovesMixin):
         - blocked: points blocked by active player
         - hittable: opponent stones that can be hit
         - unprotected: active player stones unprotected by opponent
+
+        Builds a new dict on every access; hot paths use the *_mask() methods.
         """
         return {
-            'occupied': self._occ_mask[self.turn],
-            'blocked': self._blocked_mask[self.turn],
-            'hittable': remove_from_mask(self._occ_mask[self.opp], self._blocked_mask[self.turn]),
-            'unprotected': remove_from_mask(self._occ_mask[self.turn], self._blocked_mask[self.opp]),
+            'occupied': self.occ_mask(),
+            'blocked': self.blocked_mask(),
+            'hittable': self.hittable_mask(),
+            'unprotected': self.unprotected_mask(),
         }
 
+    @property
+    def stones_by_player(self) -> Tuple[List[int], List[int]]:
+        """
+        Return the stone counts of every point (0-25) for both players.
+
+        The lists are the state's internal counts, not copies: treat them as
+        read-only and do not hold on to them across moves.
+
+        Returns:
+            Tuple[List[int], List[int]]: Per-point counts for player 0 and player 1.
+        """
+        return self._counts
+
     def is_on_board(self, point: int) -> bool:
         """Check if a point index is on the board."""
         return BOARD_START <= point <= BOARD_END
@@ -218,49 +390,54 @@ class BackgammonState(BackgammonMovesMixin):
             int: Number of stones of the player at the point.
         """
         if player is not None:
-            sign = STONE[player]
-            val = self.board[point] * sign
-            return val if val > 0 else 0
+            return self._counts[player][point]
 
     # ---------- Masks / Updates ----------
-    def _update_occupied(self, point: int) -> None:
-        """Update the occupancy bitmask for a given point."""
-        for player in (0,1):
-            if self.num_of_stones(point, player) > 0:
-                self._occ_mask[player] = set_bit(point, self._occ_mask[player])
-            else:
-                self._occ_mask[player] = clear_bit(point, self._occ_mask[player])
- 
-    def _update_blocked(self, point: int) -> None:
-        """Update the blocked bitmask for a given point."""
-        for player in (0,1):
-            opp = 1 - player
-            if self.num_of_stones(point, opp) >= 2:
-                self._blocked_mask[player] = set_bit(point, self._blocked_mask[player])
-            else:
-                self._blocked_mask[player] = clear_bit(point, self._blocked_mask[player])
-    
     def _recompute_masks(self) -> None:
-        """Recompute all occupancy and blocked masks for both players."""
-        for player in (0, 1):
-            opp = 1 - player
-            occ = np.flatnonzero(self.board * STONE[player] > 0)
-            blocked = np.flatnonzero(self.board * STONE[opp] >= 2)
-            self._occ_mask[player] = bits_from_indices(occ)
-            self._blocked_mask[player] = bits_from_indices(blocked)
+        """Recompute the stone counts, all occupancy and blocked masks and the bear-off flags."""
+        board = self.board.tolist()
+        self._all_borne_off = 0
+        for player, count in enumerate(self.bear_off_stones.tolist()):
+            if count == NUM_OF_ALL_STONES[player]:
+                self._all_borne_off |= 1 << player
+
+        counts0 = [0] * 26
+        counts1 = [0] * 26
+        occ0 = occ1 = blocked0 = blocked1 = 0
+        # Single pass over native ints: player 1 stones are positive, player 0 negative
+        for point, v in enumerate(board):
+            if v > 0:
+                counts1[point] = v
+                occ1 |= 1 << point
+                if v >= 2:
+                    blocked0 |= 1 << point
+            elif v < 0:
+                counts0[point] = -v
+                occ0 |= 1 << point
+                if v <= -2:
+                    blocked1 |= 1 << point
+        self._counts = (counts0, counts1)
+        self._occ_mask[:] = [occ0, occ1]
+        self._blocked_mask[:] = [blocked0, blocked1]
+        self._derived_key = -1
 
     # ---------- Stone primitives ----------
     def _add_stone(self, point: int, player: int) -> None:
         """Add a stone to a point for a player and update masks and hash."""
-        old_count = self.num_of_stones(point, player)
+        counts = self._counts[player]
+        old_count = counts[point]
         self.board[point] += STONE[player]
-        new_count = self.num_of_stones(point, player)
+        new_count = counts[point] = old_count + 1
 
-        self.zobrist_hash ^= ZOBRIST_TABLE[point][player][old_count]
-        self.zobrist_hash ^= ZOBRIST_TABLE[point][player][new_count]
+        self.zobrist_hash ^= ZOBRIST_TABLE[(point << 5) | (player << 4) | old_count]
+        self.zobrist_hash ^= ZOBRIST_TABLE[(point << 5) | (player << 4) | new_count]
 
-        self._update_occupied(point)
-        self._update_blocked(point)
+        # Only this player's count changed: occupied by player, blocked for opponent at >= 2
+        bit = 1 << point
+        self._occ_mask[player] |= bit
+        if new_count >= 2:
+            self._blocked_mask[1 - player] |= bit
+        self.version += 1
 
     def _remove_stone(self, point: int, player: int) -> int:
         """Remove a stone from a point for a player and update masks and hash.
@@ -268,23 +445,38 @@ class BackgammonState(BackgammonMovesMixin):
         Returns:
             int: The stone removed (+1 or -1)
         """
-        old_count = self.num_of_stones(point, player)
+        counts = self._counts[player]
+        old_count = counts[point]
         if old_count == 0:
             return 0
         self.board[point] -= STONE[player]
-        new_count = self.num_of_stones(point, player)
+        new_count = counts[point] = old_count - 1
 
-        self.zobrist_hash ^= ZOBRIST_TABLE[point][player][old_count]
-        self.zobrist_hash ^= ZOBRIST_TABLE[point][player][new_count]
+        self.zobrist_hash ^= ZOBRIST_TABLE[(point << 5) | (player << 4) | old_count]
+        self.zobrist_hash ^= ZOBRIST_TABLE[(point << 5) | (player << 4) | new_count]
 
-        self._update_occupied(point)
-        self._update_blocked(point)
+        bit = 1 << point
+        if new_count == 0:
+            self._occ_mask[player] &= ~bit
+        if new_count < 2:
+            self._blocked_mask[1 - player] &= ~bit
+        self.version += 1
         return STONE[player]
 
     # ---------- Turn ----------
+    def set_turn(self, turn: int) -> None:
+        """Make the given player active and refresh the per-turn lookups."""
+        self.turn = turn
+        self._opp = 1 - turn
+        self._stone_turn = STONE[turn]
+        self._dir_turn = DIRECTION[turn]
+        self._bar_turn = BAR_FIELD[turn]
+        self._bar_bit_turn = 1 << BAR_FIELD[turn]
+        self.version += 1
+
     def switch_turn(self) -> None:
         """Switch the active player (0 <-> 1)."""
-        self.turn = 1 - self.turn
+        self.set_turn(self._opp)
 
     # ---------- Serialization ----------
     def place_stones_from_list(self, positions: List[List[Tuple[int,int]]]) -> None:
@@ -300,18 +492,20 @@ class BackgammonState(BackgammonMovesMixin):
             if total + self.bear_off_stones[player] != NUM_OF_ALL_STONES[player]:
                 raise ValueError("Invalid number of stones")
         self._recompute_masks()
+        self.version += 1
 
     def state_to_list(self) -> List[List[Tuple[int,int]]]:
         """Serialize the board into a list of positions per player."""
         positions: List[List[Tuple[int,int]]] = [[], []]
-        for point, stones in enumerate(self.board):
+        nz = np.flatnonzero(self.board)
+        for point, stones in zip(nz.tolist(), self.board[nz].tolist()):
             if stones < 0:
                 positions[0].append((point, -stones))
-            elif stones > 0:
+            else:
                 positions[1].append((point, stones))
-        for player in (0, 1):
-            if self.bear_off_stones[player] > 0:
-                positions[player].append((-1, self.bear_off_stones[player]))
+        for player, count in enumerate(self.bear_off_stones.tolist()):
+            if count > 0:
+                positions[player].append((-1, count))
         return positions
 
     # ---------- Zobrist / Hash ----------
@@ -330,15 +524,17 @@ class BackgammonState(BackgammonMovesMixin):
     def update_zobrist_hash(self) -> None:
         """Recompute the Zobrist hash of the current state."""
         h = 0
-        for point in range(26):
-            for player in (0, 1):
-                count = self.num_of_stones(point, player)
-                if count > 0:
-                    h ^= ZOBRIST_TABLE[point][player][count]
+        # Only occupied points contribute (count-0 keys are zero)
+        nz = np.flatnonzero(self.board)
+        for point, v in zip(nz.tolist(), self.board[nz].tolist()):
+            if v > 0:
+                h ^= ZOBRIST_TABLE[zobrist_index(point, 1, v)]
+            else:
+                h ^= ZOBRIST_TABLE[zobrist_index(point, 0, -v)]
         for player in (0, 1):
             count = self.bear_off_stones[player]
             if count > 0:
-                h ^= ZOBRIST_TABLE[26 + player][player][count]
+                h ^= ZOBRIST_TABLE[zobrist_index(26 + player, player, int(count))]
         h ^= ZOBRIST_PLAYER[self.turn]
         self.zobrist_hash = h
 
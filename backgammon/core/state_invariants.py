@@ -25,7 +25,7 @@ def assert_stone_invariant(state: Any, where: str = "") -> None:
     """
     for p in (0, 1):
         board = sum(state.num_of_stones(i, p) for i in range(BOARD_START, BOARD_END + 1))
-        bar = abs(state.board[BAR_FIELD[p]])
+        bar = state.num_of_stones(BAR_FIELD[p], p)
         total = board + bar + state.bear_off_stones[p]
 
         if total != NUM_OF_ALL_STONES[p]:
@@ -2,12 +2,17 @@
 # --- core_undo.py ---
 # =========================================================
 
+import numpy as np
 from collections import deque
-from typing import Optional
+from typing import Optional, Tuple
 
 from .state import BackgammonState
 from .moves import SingleMove
 
+#: Snapshot diff: changed board points, their values in the previous snapshot,
+#: and the previous snapshot's bear-off counts, turn and Zobrist hash
+SnapshotDiff = Tuple[np.ndarray, np.ndarray, Tuple[int, int], int, int]
+
 # =========================================================
 
 class Undo:
@@ -16,7 +21,12 @@ class Undo:
 
     Maintains both:
         - move-based history (atomic SingleMove undo)
-        - snapshot-based history (full board snapshots)
+        - snapshot-based history (board snapshots)
+
+    Only the newest snapshot is kept in full; every entry in ``snapshots`` stores
+    the points that changed against the snapshot before it (None for the first),
+    so older snapshots are rebuilt by replaying diffs backwards. The full board
+    lives in one preallocated array that is overwritten in place.
     """
 
     def __init__(self, max_moves: int = 100, max_snapshots: int = 10) -> None:
@@ -28,7 +38,12 @@ class Undo:
             max_snapshots: Maximum number of board snapshots to store.
         """
         self.move_history: deque[SingleMove] = deque(maxlen=max_moves)
-        self.snapshots: deque[BackgammonState] = deque(maxlen=max_snapshots)
+        self.snapshots: deque[Optional[SnapshotDiff]] = deque(maxlen=max_snapshots)
+        self._last_board: np.ndarray = np.zeros(26, dtype=np.int8)
+        self._has_last: bool = False
+        self._last_bear_off: Tuple[int, int] = (0, 0)
+        self._last_turn: int = 0
+        self._last_hash: int = 0
 
     def record_move(self, move: SingleMove) -> None:
         """
@@ -70,12 +85,26 @@ class Undo:
 
     def record_snapshot(self, state: BackgammonState) -> None:
         """
-        Record a full snapshot of the current state.
+        Record a snapshot of the current state.
+
+        Snapshots are only taken on explicit request; the engine's turn loop
+        records moves alone, so normal play never pays for a snapshot.
 
         Args:
             state: The BackgammonState to snapshot.
         """
-        self.snapshots.append(state.copy())
+        board = state.board
+        if not self._has_last:
+            diff: Optional[SnapshotDiff] = None
+        else:
+            changed = np.flatnonzero(board != self._last_board)
+            diff = (changed, self._last_board[changed], self._last_bear_off, self._last_turn, self._last_hash)
+        self.snapshots.append(diff)
+        np.copyto(self._last_board, board)
+        self._has_last = True
+        self._last_bear_off = tuple(state.bear_off_stones.tolist())
+        self._last_turn = state.turn
+        self._last_hash = state.zobrist_hash
 
     def undo_last_snapshot(self, state: BackgammonState) -> None:
         """
@@ -90,10 +119,17 @@ class Undo:
         if not self.snapshots:
             raise ValueError("No snapshots available")
 
-        snapshot: BackgammonState = self.snapshots.pop()
-        state.board[:] = snapshot.board
-        state.bear_off_stones[:] = snapshot.bear_off_stones
-        state._occ_mask = snapshot._occ_mask.copy()
-        state._blocked_mask = snapshot._blocked_mask.copy()
+        diff = self.snapshots.pop()
+        np.copyto(state.board, self._last_board)
+        state.bear_off_stones[:] = self._last_bear_off
+        # Counts and masks are derived from the board; nothing mask-shaped is stored or copied
         state._recompute_masks()
-        state.turn = snapshot.turn
+        state.set_turn(self._last_turn)  # also bumps state.version
+        state.zobrist_hash = self._last_hash
+
+        # Rebuild the previous snapshot in place from the popped diff
+        if diff is None or not self.snapshots:
+            self._has_last = False
+        else:
+            changed, values, self._last_bear_off, self._last_turn, self._last_hash = diff
+            self._last_board[changed] = values
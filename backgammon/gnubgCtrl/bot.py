@@ -3,9 +3,10 @@
 # =========================================================
 
 import os
+from collections import deque
 from datetime import datetime
 from contextlib import redirect_stdout
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, TextIO
 
 from core.moves import SingleMoveType, SingleMove, TurnMove
 from core.state import BackgammonState
@@ -22,12 +23,30 @@ from .resolver import GnuBGMoveResolver
 
 # =========================================================
 
+#: Bound formatter for one SingleMove in GNUBG notation ("from/to")
+_GNUBG_MOVE_FORMAT = "{0.from_point}/{0.to_point}".format
+
+
 class GnuBGBot:
     """
     Bot interface for GNUBG. Parses GNUBG output, keeps engine state, 
     and generates moves or responses automatically.
     """
 
+    #: GNUBG info keys and the handler method each one triggers, in dispatch order
+    _DISPATCH = (
+        ("unknown_keyword", "_queue_exit"),
+        ("illegal_move", "_queue_exit"),
+        ("waiting_double", "_queue_exit"),
+        ("game_over", "_queue_exit"),
+        ("give_up", "_queue_accept"),
+        ("game_start_info", "_ignore"),
+        ("cube_refused", "_ignore"),
+        ("double_offered", "_on_double_offered"),
+        ("board_detected", "handle_board"),
+        ("gnubg_move_detected", "handle_gnubg_move"),
+    )
+
     def __init__(self, bot_player_type: str = "ComputerPlayer", log_file: Optional[str] = None, debug: bool = True) -> None:
         """
         Initialize the bot.
@@ -45,26 +64,35 @@ class GnuBGBot:
         self.debug: bool = debug
         self.log_file: Optional[str] = log_file
         self.log_entry_counter: int = 1
-        self._pending_commands: List[str] = []
+        self._log_fh: Optional[TextIO] = None
+        self._pending_commands: deque[str] = deque()
+
+        # Players are fixed for the session; build them once instead of per access
+        self._bot_player: ComputerPlayer = self._create_bot_player()
+        self._player_prop: Dict[str, Dict[str, Any]] = {
+            "bot": {"engine_id": 0, "token": "X", "player_type": self._bot_player},
+            "gnubg": {"engine_id": 1, "token": "O", "player_type": None}
+        }
 
         self.setup_engine()
 
     # --- Setup ---
-    @property
-    def bot_player_type(self) -> ComputerPlayer:
-        """Return an instance of the bot player."""
+    def _create_bot_player(self) -> ComputerPlayer:
+        """Create the bot player for the configured player type."""
         __bot_engine_id = 0
         if self._bot_player_type == "ComputerPlayer":
             return ComputerPlayer(id=__bot_engine_id)
         raise ValueError("No valid player type found!")
 
+    @property
+    def bot_player_type(self) -> ComputerPlayer:
+        """Return the bot player instance."""
+        return self._bot_player
+
     @property   
     def player_prop(self) -> Dict[str, Dict[str, Any]]:
         """Return properties of bot and GNUBG players."""
-        return {
-            "bot": {"engine_id": 0, "token": "X", "player_type": self.bot_player_type},
-            "gnubg": {"engine_id": 1, "token": "O", "player_type": None}
-        }
+        return self._player_prop
 
     def setup_engine(self) -> GameEngine:
         """Initialize the game engine with players if not already initialized."""
@@ -116,7 +144,7 @@ class GnuBGBot:
         Returns:
             GNUBG-style move string, e.g. "24/23 8/7".
         """
-        return " ".join(f"{sm.from_point}/{sm.to_point}" for sm in turn.single_moves)
+        return " ".join(map(_GNUBG_MOVE_FORMAT, turn.single_moves))
 
     def _handle_bot_move(self, board_out: Dict[str, Any]) -> None:
         """Generate bot moves if it's the bot's turn to move."""
@@ -156,10 +184,26 @@ class GnuBGBot:
         self.sync_engine_turn_and_dice("gnubg")
         resolver = GnuBGMoveResolver(
             self._engine, self._dice, self.player_prop["gnubg"],
-            log_file=self.log_file if self.debug else None
+            log_file=self.log_file if self.debug else None,
+            log_stream=self._log_stream() if self.debug else None
         )
         resolver.apply_moves(moves)
 
+    def _queue_exit(self, result: Dict[str, Any]) -> None:
+        """Queue an exit command."""
+        self._pending_commands.append("exit")
+
+    def _queue_accept(self, result: Dict[str, Any]) -> None:
+        """Queue an accept command."""
+        self._pending_commands.append("accept")
+
+    def _ignore(self, result: Dict[str, Any]) -> None:
+        """Acknowledge an info without acting on it."""
+
+    def _on_double_offered(self, result: Dict[str, Any]) -> None:
+        """Forward a cube offer to handle_double."""
+        self.handle_double(result.get("gnubg_info", []))
+
     def handle_prompt(self, result: Dict[str, Any]) -> bool:
         """
         Handle GNUBG prompts and generate bot commands.
@@ -179,6 +223,18 @@ class GnuBGBot:
         return False
     
     # --- Logging ---
+    def _log_stream(self) -> Optional[TextIO]:
+        """Return the session log handle, opening it on first use."""
+        if self._log_fh is None and self.log_file:
+            self._log_fh = open(self.log_file, "a", encoding="utf-8")
+        return self._log_fh
+
+    def close_log(self) -> None:
+        """Close the session log handle if it is open."""
+        if self._log_fh is not None:
+            self._log_fh.close()
+            self._log_fh = None
+
     def log_bot_action(self, cmd: Optional[str] = None, board_display: bool = False, gnubg_info: Any = False) -> None:
         """
         Log bot actions, commands, board state, and GNUBG info to the log file.
@@ -188,62 +244,52 @@ class GnuBGBot:
             board_display: Whether to print the board to the log.
             gnubg_info: GNUBG info list to log.
         """
-        if not self.log_file:
+        f = self._log_stream()
+        if f is None:
             return
-        with open(self.log_file, "a", encoding="utf-8") as f:
-            f.write("\n" + "="*50 + "\n")
-            f.write(f"ENTRY {self.log_entry_counter} - {datetime.now()}\n\n")
-            f.write("COMMAND:\n")
-            f.write(str(cmd) if cmd else "<no command>\n")
-            f.write("\nBOARD:\n")
-            if board_display:
-                bd = BoardDisplay(self._engine.state, clear_screen=False, use_color=False)
-                with redirect_stdout(f):
-                    bd.draw_all()
-            else:
-                f.write("<no board>\n")
-            f.write("\nGNUBG INFO:\n")
-            f.write(f"{gnubg_info}\n")
+        f.write("\n" + "="*50 + "\n")
+        f.write(f"ENTRY {self.log_entry_counter} - {datetime.now()}\n\n")
+        f.write("COMMAND:\n")
+        f.write(str(cmd) if cmd else "<no command>\n")
+        f.write("\nBOARD:\n")
+        if board_display:
+            bd = BoardDisplay(self._engine.state, clear_screen=False, use_color=False)
+            with redirect_stdout(f):
+                bd.draw_all()
+        else:
+            f.write("<no board>\n")
+        f.write("\nGNUBG INFO:\n")
+        f.write(f"{gnubg_info}\n")
+        f.flush()
         self.log_entry_counter += 1
 
     # --- Main Command Selection ---
-    def select_command(self, data: str) -> Optional[str]:
+    def select_command(self, data: str, parsed: Optional[Dict[str, Any]] = None) -> Optional[str]:
         """
         Parse GNUBG output and decide the next bot command.
 
         Args:
             data: GNUBG output text.
+            parsed: Parse result of data if the caller already has one.
 
         Returns:
             Next command string for GNUBG, or None if no command.
         """
-        result: Dict[str, Any] = self.parser.parse(data)
+        result: Dict[str, Any] = parsed if parsed is not None else self.parser.parse(data)
         gnubg_info: List[str] = result.get("gnubg_info", [])
 
-        action_handler: Dict[str, Any] = {
-            "unknown_keyword": lambda _: self._pending_commands.append("exit"),
-            "illegal_move": lambda _: self._pending_commands.append("exit"),
-            "waiting_double": lambda _: self._pending_commands.append("exit"),
-            "game_over": lambda _: self._pending_commands.append("exit"),
-            "give_up": lambda _: self._pending_commands.append("accept"),
-            "game_start_info": lambda _: None,
-            "cube_refused": lambda _: None,
-            "double_offered": lambda _: self.handle_double(gnubg_info),
-            "board_detected": lambda _: self.handle_board(result),
-            "gnubg_move_detected": lambda _: self.handle_gnubg_move(result),
-        }
-
-        for info, handler in action_handler.items():
-            if info in gnubg_info:
-                handler(None)
+        info_set = set(gnubg_info)  # built once, reused for every membership test below
+        for info, handler in self._DISPATCH:
+            if info in info_set:
+                getattr(self, handler)(result)
 
-        if "prompt_detected" in gnubg_info:
+        if "prompt_detected" in info_set:
             self.handle_prompt(result)
-            cmd = self._pending_commands.pop(0) if self._pending_commands else None
+            cmd = self._pending_commands.popleft() if self._pending_commands else None
         else:
             cmd = None
 
         if self.debug:
-            self.log_bot_action(cmd, "board_detected" in gnubg_info, gnubg_info)
+            self.log_bot_action(cmd, "board_detected" in info_set, gnubg_info)
 
         return cmd
@@ -4,17 +4,15 @@
 
 import os
 import pty
-import fcntl
 import sys
 import select
 import subprocess
-import time
 import json
 import re
 import signal
 from datetime import datetime
 from contextlib import contextmanager
-from typing import Optional, List
+from typing import Optional, List, Dict, Any, TextIO
 
 from cli.cliUtils import clear
 
@@ -23,6 +21,16 @@ from .bot import GnuBGBot
 
 # =========================================================
 
+#: Bytes requested per pty read while waiting for a prompt
+READ_CHUNK_SIZE = 65536
+
+#: Upper bound in bytes of one _read_all() drain (size of its reused buffer)
+READ_ALL_LIMIT = 262144
+
+#: ANSI CSI escape sequences (compiled once, used on every pty read)
+_ANSI_RE = re.compile(r'\x1B\[[0-?]*[ -/]*[@-~]')
+
+
 def strip_ansi(s: str) -> str:
     """
     Remove ANSI escape sequences from a string.
@@ -33,12 +41,41 @@ def strip_ansi(s: str) -> str:
     Returns:
         String with ANSI codes removed.
     """
-    ansi_escape = re.compile(r'\x1B\[[0-?]*[ -/]*[@-~]')
-    return ansi_escape.sub("", s)
+    # Most chunks carry no escapes at all; skip the regex engine for them
+    if "\x1b" not in s:
+        return s
+    return _ANSI_RE.sub("", s)
+
+
+#: Same pattern on raw bytes (escape sequences are pure ASCII)
+_ANSI_BYTES_RE = re.compile(rb'\x1B\[[0-?]*[ -/]*[@-~]')
+
+
+def _strip_ansi_bytes(b: bytes) -> bytes:
+    """
+    Remove ANSI escape sequences from raw bytes, before decoding.
+
+    Args:
+        b: Raw pty output.
+
+    Returns:
+        Bytes with ANSI codes removed.
+    """
+    if b"\x1b" not in b:
+        return b
+    return _ANSI_BYTES_RE.sub(b"", b)
 
 
 class PromptDetector:
-    """Detects GNUBG prompts in the output buffer."""
+    """
+    Detects GNUBG prompts in the output buffer.
+
+    Fed chunks are collected in a list and only joined by get_buffer. All prompts
+    are matched by one compiled alternation, and each feed scans just the new
+    chunk plus a short tail of the previous data (long enough for a prompt split
+    across reads). The end offset of the first hit is remembered, so get_buffer
+    can cut the buffer without searching again.
+    """
 
     def __init__(self, prompts: Optional[List[str]] = None) -> None:
         """
@@ -46,16 +83,48 @@ class PromptDetector:
             prompts: Optional list of prompt strings to detect.
         """
         self.prompts: List[str] = prompts or ["(Keine Partie)", "(sebastian)", "Are you sure you want to discard the current match?"]
-        self.buffer: str = ""
-    
+        self._prompt_re: re.Pattern = re.compile("|".join(re.escape(p) for p in self.prompts))
+        self._keep: int = max(len(p) for p in self.prompts) - 1
+        self._parts: List[str] = []
+        self._size: int = 0
+        self._tail: str = ""
+        self._hit_end: Optional[int] = None
+
+    @property
+    def buffer(self) -> str:
+        """Return the buffered (ANSI-stripped) output as one string."""
+        return "".join(self._parts)
+
     def reset(self) -> None:
         """Reset the buffer."""
-        self.buffer = ""
+        self._set_buffer("")
+
+    def _set_buffer(self, text: str) -> None:
+        """Replace the buffer content and rescan it for prompts."""
+        self._parts = [text] if text else []
+        self._size = 0
+        self._tail = ""
+        self._hit_end = None
+        self._scan(text)
+
+    def _scan(self, data: str) -> None:
+        """Search newly buffered data (joined with the kept tail) for a prompt."""
+        window = self._tail + data
+        start = self._size - len(self._tail)
+        self._size += len(data)
+        m = self._prompt_re.search(window)
+        if m:
+            self._hit_end = start + m.end()
+        self._tail = window[max(0, len(window) - self._keep):]
 
     def feed(self, data: str) -> None:
         """Feed new data into the buffer after stripping ANSI codes."""
         data = strip_ansi(data)
-        self.buffer += data
+        self._parts.append(data)
+        if self._hit_end is None:
+            self._scan(data)
+        else:
+            self._size += len(data)
 
     def ready(self) -> bool:
         """
@@ -64,7 +133,7 @@ class PromptDetector:
         Returns:
             True if any prompt is found, False otherwise.
         """
-        return any(p in self.buffer for p in self.prompts)
+        return self._hit_end is not None
 
     def get_buffer(self) -> str:
         """
@@ -73,15 +142,10 @@ class PromptDetector:
         Returns:
             Extracted buffer up to next prompt.
         """
-        for p in self.prompts:
-            if p in self.buffer:
-                idx = self.buffer.index(p) + len(p)
-                buf = self.buffer[:idx]
-                self.buffer = self.buffer[idx:]
-                return buf
-        buf = self.buffer
-        self.buffer = ""
-        return buf
+        buffer = self.buffer
+        idx = self._hit_end if self._hit_end is not None else len(buffer)
+        self._set_buffer(buffer[idx:])
+        return buffer[:idx]
 
 
 class GnuBGController:
@@ -106,6 +170,12 @@ class GnuBGController:
         self.master_fd: Optional[int] = None
         self.slave_fd: Optional[int] = None
         self._gnubg_pid: Optional[int] = None
+        self._poller: Optional[select.poll] = None
+        self._log_fh: Optional[TextIO] = None
+
+        # Reused by _read_all(); only the bytes actually read are copied out
+        self._read_buf: bytearray = bytearray(READ_ALL_LIMIT)
+        self._read_view: memoryview = memoryview(self._read_buf)
 
         self.last_command: Optional[str] = None
         self.prompt_detector: PromptDetector = PromptDetector(prompts)
@@ -126,8 +196,15 @@ class GnuBGController:
         self._gnubg_pid = self.proc.pid
 
         # Set master_fd non-blocking
-        flags = fcntl.fcntl(self.master_fd, fcntl.F_GETFL)
-        fcntl.fcntl(self.master_fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+        os.set_blocking(self.master_fd, False)
+
+        # One poller for the pty (and stdin in interactive mode); wakes on data
+        self._poller = select.poll()
+        self._poller.register(self.master_fd, select.POLLIN)
+
+        # Keep the log open for the session instead of reopening it per entry
+        if self.debug and self.log_file:
+            self._log_fh = open(self.log_file, "a", encoding="utf-8")
 
     def stop(self) -> None:
         """Stop the GNUBG subprocess and close file descriptors."""
@@ -139,6 +216,13 @@ class GnuBGController:
                 self.proc.kill()
                 self.proc.wait()
 
+        self._poller = None
+        if self._log_fh is not None:
+            self._log_fh.close()
+            self._log_fh = None
+        if self.bot:
+            self.bot.close_log()
+
         if self.master_fd is not None:
             os.close(self.master_fd)
             self.master_fd = None
@@ -157,40 +241,47 @@ class GnuBGController:
         Args:
             cmd: Command string. Can be None.
         """
-        if cmd == 'y':
-            os.write(self.master_fd, b"y\n")
-            time.sleep(0.05)
-            os.write(self.master_fd, b"y\n")
-                
         if not cmd:
             return
-        os.write(self.master_fd, (cmd + "\n").encode())
+        if cmd == 'y':
+            # Confirmations go out in one write: gnubg reads them line by line from the pty
+            os.write(self.master_fd, b"y\ny\ny\n")
+        else:
+            os.write(self.master_fd, (cmd + "\n").encode())
         self.last_command = cmd
 
-    def log_gnubg_entry(self, data: str, cmd: Optional[str] = None) -> None:
+    def log_gnubg_entry(self, data: str, cmd: Optional[str] = None, parsed: Optional[Dict[str, Any]] = None) -> None:
         """
         Log GNUBG output, command, and parsed data.
 
         Args:
             data: Raw GNUBG output.
             cmd: Command sent.
+            parsed: Parse result of the output if already available; parsed here otherwise.
         """
-        if not self.log_file:
+        if not self.debug or not self.log_file:
             return
 
-        parsed = self.parser.parse(data)
-        with open(self.log_file, "a", encoding="utf-8") as f:
-            f.write("\n" + "="*50 + "\n")
-            f.write(f"ENTRY {self.log_entry_counter} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            f.write("INPUT:\n")
-            f.write(str(cmd) if cmd else "<no input>")
-            f.write("\n\nOUTPUT:\n")
-            f.write(data)
-            if not data.endswith("\n"):
-                f.write("\n")
-            f.write("\nPARSED_DATA:\n")
-            f.write(json.dumps(parsed, indent=2, ensure_ascii=False))
-            f.write("\n")
+        if parsed is None:
+            parsed = self.parser.parse(data)
+        entry = "".join((
+            "\n" + "="*50 + "\n",
+            f"ENTRY {self.log_entry_counter} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+            "INPUT:\n",
+            str(cmd) if cmd else "<no input>",
+            "\n\nOUTPUT:\n",
+            data,
+            "" if data.endswith("\n") else "\n",
+            "\nPARSED_DATA:\n",
+            json.dumps(parsed, indent=2, ensure_ascii=False),
+            "\n",
+        ))
+        if self._log_fh is not None:
+            self._log_fh.write(entry)
+            self._log_fh.flush()
+        else:
+            with open(self.log_file, "a", encoding="utf-8") as f:
+                f.write(entry)
 
         self.log_entry_counter += 1
 
@@ -198,35 +289,36 @@ class GnuBGController:
         """Remove echoed command from the output if present."""
         if not last_command:
             return data
-        lines = data.splitlines(keepends=True)
-        if lines and lines[0].strip() == last_command.strip():
-            lines = lines[1:]
-        return "".join(lines)
-
-    def _read_all(self, limit: int = 262144) -> str:
+        # Only the first line matters: find it instead of splitting the whole output
+        nl = data.find("\n")
+        first = data if nl < 0 else data[:nl]
+        if first.strip() == last_command.strip():
+            return "" if nl < 0 else data[nl + 1:]
+        return data
+
+    def _read_all(self, limit: int = READ_ALL_LIMIT) -> str:
         """
         Read all available data from master_fd up to a byte limit.
 
         Args:
-            limit: Maximum number of bytes to read.
+            limit: Maximum number of bytes to read (capped at READ_ALL_LIMIT).
 
         Returns:
             Cleaned string with ANSI codes removed.
         """
-        chunks: List[bytes] = []
+        # Read straight into the preallocated buffer; decode once at the end
+        view = self._read_view
+        limit = min(limit, len(view))
         size = 0
         while size < limit:
             try:
-                data = os.read(self.master_fd, 8192)
-                if not data:
+                n = os.readv(self.master_fd, [view[size:limit]])
+                if not n:
                     break
-                chunks.append(data)
-                size += len(data)
+                size += n
             except BlockingIOError:
                 break
-        raw = b"".join(chunks).decode(errors="ignore")
-        clean = strip_ansi(raw)
-        return clean
+        return _strip_ansi_bytes(bytes(view[:size])).decode(errors="ignore")
 
     def _read_until_prompt(self) -> str:
         """
@@ -237,23 +329,29 @@ class GnuBGController:
         """
         while not self.prompt_detector.ready():
             try:
-                data = os.read(self.master_fd, 8192)
+                data = os.read(self.master_fd, READ_CHUNK_SIZE)
                 if not data:
                     break
-                text = data.decode(errors="ignore")
+                text = _strip_ansi_bytes(data).decode(errors="ignore")
                 self.prompt_detector.feed(text)
             except BlockingIOError:
-                time.sleep(0.01)
+                # Block until output arrives (10 ms cap) instead of sleeping a fixed quantum
+                self._poller.poll(10)
         buf = self.prompt_detector.get_buffer()
         self.prompt_detector.reset()
         return buf
 
-    def _handle_output(self, data: str) -> None:
-        """Process GNUBG output: filter echo, print, log, and reset last_command."""
+    def _handle_output(self, data: str, parsed: Optional[Dict[str, Any]] = None) -> None:
+        """Process GNUBG output: filter echo, print, log, and reset last_command.
+
+        Args:
+            data: Raw GNUBG output.
+            parsed: Optional parse result shared with the bot, so the log does not parse again.
+        """
         data = self._filter_echo(data, self.last_command)
         print(data)
         if self.debug and self.log_file:
-            self.log_gnubg_entry(data, self.last_command)
+            self.log_gnubg_entry(data, self.last_command, parsed)
         self.last_command = None
 
     # --------------------------------------------------
@@ -261,15 +359,18 @@ class GnuBGController:
     # --------------------------------------------------
     def run_interactive(self) -> None:
         """Run GNUBG interactively with user input."""
+        stdin_fd = sys.stdin.fileno()
+        self._poller.register(stdin_fd, select.POLLIN)
         try:
             while self.proc.poll() is None:
-                data = self._read_all()
-                if data:
-                    self._handle_output(data)
-                ready, _, _ = select.select([sys.stdin], [], [], 0.05)
-                if ready:
-                    cmd = sys.stdin.readline().rstrip("\n")
-                    self.send(cmd)
+                for fd, _ in self._poller.poll(50):
+                    if fd == self.master_fd:
+                        data = self._read_all()
+                        if data:
+                            self._handle_output(data)
+                    elif fd == stdin_fd:
+                        cmd = sys.stdin.readline().rstrip("\n")
+                        self.send(cmd)
         except KeyboardInterrupt:
             print("\n[CTRL-C] terminate gnubg…")
         finally:
@@ -284,8 +385,12 @@ class GnuBGController:
                 data = self._read_until_prompt()
                 if not data:
                     continue
-                self._handle_output(data)
-                cmd = self.bot.select_command(data)
+                parsed = self.bot.parser.parse(data)
+                self._handle_output(data, parsed)
+                cmd = self.bot.select_command(data, parsed)
+                # One command per prompt on purpose: the next reply decides what the bot
+                # sends after it (e.g. the move depends on the dice shown after 'roll'),
+                # and echo filtering is keyed on last_command, so commands are not batched
                 if cmd:
                     self.send(cmd)
         except KeyboardInterrupt:
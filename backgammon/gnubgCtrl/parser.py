@@ -4,10 +4,56 @@
 
 import re
 import json
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Union, Tuple, Callable
 
 # =========================================================
 
+#: Literal markers of the plain-text detectors, tested with `in`
+_CUBE_REFUSED = "... refuses the cube and gives up ..."
+_ILLEGAL_MOVE = "Illegal or unparsable move."
+_UNKNOWN_KEYWORD = "Unknown keyword"
+_START_INFO = "Copyright"
+_EXIT_INFO = "Are you sure you want to discard the current match?"
+_GAME_OVER = "Spielstand"
+_DOUBLE_OFFERED = "gnubg do"
+
+#: Marker pairs that must appear in this order (see _in_order)
+_GIVE_UP = ("gnubg", "aufzugeben")
+_WAITING_DOUBLE = ("Bitte warte", "Doppler-Entscheidung")
+
+#: Literal fragments of which every detector needs at least one.
+#: Output containing none of them cannot match any detector.
+_INDICATORS = (
+    "+12-11-10",                # board (both orientations)
+    "gnubg",                    # moves, doubles, give up
+    _CUBE_REFUSED,
+    _ILLEGAL_MOVE,
+    _UNKNOWN_KEYWORD,
+    _WAITING_DOUBLE[0],
+    _START_INFO,
+    _EXIT_INFO,
+    _GAME_OVER,
+    "(sebastian)",              # prompt
+    "(Keine Partie)",
+)
+_INDICATOR_RE = re.compile("|".join(re.escape(s) for s in _INDICATORS))
+
+
+def _in_order(data: str, first: str, second: str) -> bool:
+    """Return True if second occurs somewhere after first (regex "first.*second" with DOTALL)."""
+    pos = data.find(first)
+    return pos >= 0 and data.find(second, pos + len(first)) >= 0
+
+
+def _compile_patterns(node: Any, flags: int = re.DOTALL) -> Any:
+    """Compile every pattern string in a nested dict/list of patterns."""
+    if isinstance(node, dict):
+        return {key: _compile_patterns(value, flags) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_compile_patterns(value, flags) for value in node]
+    return re.compile(node, flags)
+
+
 class OutputParser:
     """
     Parser for GNU Backgammon (gnubg) textual output.
@@ -32,54 +78,65 @@ class OutputParser:
                 "X": r"X:\sgnubg"
             },
 
+            # Possessive runs (*+) where the following literal is excluded from the
+            # class: the match cannot change, but failing scans no longer backtrack
             "dice": {
                 "O": r"O:[^B]*?(\d)(\d)",
-                "X": r"\d\d[^\+B]*\+[^\+]*\+[^\+]*X:"
+                "X": r"\d\d[^\+B]*+\+[^\+]*+\+[^\+]*X:"
             },
 
             "has_to_roll": {
-                "O": r"O:[^BAR]*Am Wurf",
+                "O": r"O:[^BAR]*+Am Wurf",
                 "X": r"Am Wurf[^BAR]*X:"
             },
 
-            "move_str_1": r"gnubg.{1,50}/\d{1,2}\*?", 
-            "move_str_2": r"gnubg.{1,50}/\d{1,2}\*?\(\d\)",
-
-            "move_str": [
-                r"gnubg.{1,50}/\d{1,2}\*?",
-                r"gnubg.{1,50}/\d{1,2}\*?\(\d\)",
-                r"gnubg.{1,50}/off",
-                r"gnubg.{1,50}/off\(\d\)"
-            ],
-           
-            "double_offered": r"gnubg do",
-            "cube_refused": r"\.\.\. refuses the cube and gives up \.\.\.",
-            "illegal_move": r"Illegal or unparsable move\.",
-            "unknown_keyword": r"Unknown keyword",
-            "give_up": r"gnubg.*aufzugeben",
-            "waiting_double": r"Bitte warte.*Doppler-Entscheidung",
-            "start_info": r"Copyright",            
-            "exit_info": r"Are you sure you want to discard the current match\?",
-            "game_over": r"Spielstand",
+            # One gnubg move: "/point" with optional hit and (n) repeat, or "/off"
+            "move_str": r"gnubg.{1,50}/(?:\d{1,2}\*?|off)(?:\(\d\))?",
+
             "prompt": r"\((sebastian|Keine Partie)\)",
         }
 
+        # Compile once; detectors search with DOTALL, the prompt marker and the
+        # move extraction in parse_turn_move_gnubg without it
+        self._move_union: re.Pattern = re.compile(self.regex["move_str"])
+        board = self.regex["board"]
+        self._board_any: re.Pattern = re.compile(f"(?:{board['normal']})|(?:{board['reversed']})", re.DOTALL)
+        prompt = self.regex.pop("prompt")
+        self.regex = _compile_patterns(self.regex)
+        self.regex["prompt"] = re.compile(prompt)
+
+        # Info detectors in report order
+        self._info_checks: List[Tuple[str, Callable[[str], Any]]] = [
+            ("cube_refused", self.cube_refused_detected),
+            ("unknown_keyword", self.unknown_keyword_detected),
+            ("illegal_move", self.illegal_move_detected),
+            ("waiting_double", self.waiting_double_detected),
+            ("game_start_info", self.game_start_info_detected),
+            ("exit_info", self.exit_info_detected),
+            ("double_offered", self.double_offered),
+            ("board_detected", self.board_detected),
+            ("gnubg_move_detected", self.gnubg_move_detected),
+            ("give_up", self.give_up_detected),
+            ("game_over", self.game_over_detected),
+            ("prompt_detected", self.prompt_detected),
+        ]
+
     # --- Board Info ---
     def board_detected(self, data: str) -> bool:
         """Check if a board layout is present in the data."""
-        patterns = [self.regex["board"]["normal"], self.regex["board"]["reversed"]]
-        return any(re.search(p, data, re.DOTALL) for p in patterns)
+        # Both orientations in one alternation: a single scan of the buffer
+        return self._board_any.search(data) is not None
 
     def find_gnubg_player(self, data: str) -> Optional[str]:
         """Return 'O' or 'X' if a player is controlled by gnubg, else None."""
         for p in ["O", "X"]:
-            if re.search(self.regex["gnubg_is"][p], data, re.DOTALL):
+            if self.regex["gnubg_is"][p].search(data):
                 return p
         return None
 
     def has_to_roll(self, data: str, player: str) -> bool:
         """Return True if the specified player must roll."""
-        return bool(re.search(self.regex["has_to_roll"][player], data, re.DOTALL))
+        return self.regex["has_to_roll"][player].search(data) is not None
     
     def parse_dice(self, data: str, player: str) -> Optional[List[int]]:
         """
@@ -87,8 +144,7 @@ class OutputParser:
         
         Returns a list of two integers if found, else None.
         """
-        pattern = self.regex["dice"][player]
-        matches = re.findall(pattern, data, re.DOTALL)
+        matches = self.regex["dice"][player].findall(data)
         if not matches:
             return None
         if player == "X":
@@ -97,6 +153,23 @@ class OutputParser:
             digits = [int(matches[-1][-2]), int(matches[-1][-1])]
         return digits
 
+    def parse_board_block(self, data: str) -> Dict[str, Any]:
+        """
+        Extract player, roll and dice information from a board output.
+
+        Returns:
+            dict with gnubg_is, has_to_roll_O/X, dice_O/X and X_has_to_move.
+        """
+        dice_x = self.parse_dice(data, "X")  # scanned once, feeds dice_X and X_has_to_move
+        return {
+            "gnubg_is": self.find_gnubg_player(data),
+            "has_to_roll_O": self.has_to_roll(data, "O"),
+            "has_to_roll_X": self.has_to_roll(data, "X"),
+            "dice_O": self.parse_dice(data, "O"),
+            "dice_X": dice_x,
+            "X_has_to_move": bool(dice_x)
+        }
+
     # --- Turn Move Parsing ---
     def parse_turn_move_gnubg(self, data: str) -> Optional[List[List[str]]]:
         """
@@ -108,12 +181,12 @@ class OutputParser:
         "24/23 8/7* 6/5(2)" 
         -> [["24","23"], ["8","7*"], ["6","5"], ["6","5"]]
         """
-        move_pattern = self.regex["move_str"]
-        possible_gnubg_moves = [re.findall(p, data)[-1] for p in move_pattern if re.findall(p, data)] 
-        if not possible_gnubg_moves: 
-            return None 
-        
-        gnubg_move = max(possible_gnubg_moves, key=len)
+        # One scan with the union of the move_str patterns; the last match is the latest move
+        found = self._move_union.findall(data)
+        if not found:
+            return None
+
+        gnubg_move = found[-1]
         token_str_split = gnubg_move.split()
         raw_tokens = [token for token in token_str_split if "/" in token]
 
@@ -136,45 +209,46 @@ class OutputParser:
         return all_moves
 
     # --- Info Detection ---
+    # Literal markers use substring tests instead of a regex scan
     def double_offered(self, data: str) -> bool:
         """Check if a double was offered."""
-        return bool(re.search(self.regex["double_offered"], data, re.DOTALL))
+        return _DOUBLE_OFFERED in data
 
     def cube_refused_detected(self, data: str) -> bool:
         """Check if the cube was refused."""
-        return bool(re.search(self.regex["cube_refused"], data, re.DOTALL))
+        return _CUBE_REFUSED in data
 
     def illegal_move_detected(self, data: str) -> bool:
         """Check if an illegal move occurred."""
-        return bool(re.search(self.regex["illegal_move"], data, re.DOTALL))
+        return _ILLEGAL_MOVE in data
 
     def unknown_keyword_detected(self, data: str) -> bool:
         """Check if an unknown keyword occurred."""
-        return bool(re.search(self.regex["unknown_keyword"], data, re.DOTALL))
+        return _UNKNOWN_KEYWORD in data
 
     def waiting_double_detected(self, data: str) -> bool:
         """Check if waiting for double decision."""
-        return bool(re.search(self.regex["waiting_double"], data, re.DOTALL))
+        return _in_order(data, *_WAITING_DOUBLE)
 
     def game_start_info_detected(self, data: str) -> bool:
         """Check if game start info is present."""
-        return bool(re.search(self.regex["start_info"], data, re.DOTALL))
+        return _START_INFO in data
 
     def exit_info_detected(self, data: str) -> bool:
         """Check if exit info is present."""
-        return bool(re.search(self.regex["exit_info"], data, re.DOTALL))
+        return _EXIT_INFO in data
     
     def game_over_detected(self, data: str) -> bool:
         """Check if the game is over."""
-        return bool(re.search(self.regex["game_over"], data, re.DOTALL))
+        return _GAME_OVER in data
     
     def give_up_detected(self, data: str) -> bool:
         """Check if a player gave up."""
-        return bool(re.search(self.regex["give_up"], data, re.DOTALL))
+        return _in_order(data, *_GIVE_UP)
     
     def gnubg_move_detected(self, data: str) -> bool:
         """Check if a gnubg move is present."""
-        return any(re.search(p, data, re.DOTALL) for p in self.regex["move_str"])
+        return self.regex["move_str"].search(data) is not None
 
     # --- Prompt ---
     def prompt_detected(self, data: str) -> Optional[str]:
@@ -187,7 +261,7 @@ class OutputParser:
             "exit_info" if exit prompt is detected,
             None otherwise.
         """
-        match = re.search(self.regex["prompt"], data)
+        match = self.regex["prompt"].search(data)
         if match:
             text = match.group(1)
             if text == "Keine Partie":
@@ -205,24 +279,7 @@ class OutputParser:
         
         If no recognizable info is found, returns ["not_readable"].
         """
-        info_list: List[str] = []
-        for checker, label in [
-            (self.cube_refused_detected, "cube_refused"),
-            (self.unknown_keyword_detected, "unknown_keyword"),
-            (self.illegal_move_detected, "illegal_move"),
-            (self.waiting_double_detected, "waiting_double"),
-            (self.game_start_info_detected, "game_start_info"),
-            (self.exit_info_detected, "exit_info"),
-            (self.double_offered, "double_offered"),
-            (self.board_detected, "board_detected"),
-            (self.gnubg_move_detected, "gnubg_move_detected"),
-            (self.give_up_detected, "give_up"),
-            (self.game_over_detected, "game_over"),
-            (self.prompt_detected, "prompt_detected")
-        ]:
-            if checker(data):
-                info_list.append(label)
-
+        info_list = [label for label, checker in self._info_checks if checker(data)]
         return info_list if info_list else ["not_readable"]
 
     # --- Main Parse ---
@@ -230,6 +287,9 @@ class OutputParser:
         """
         Parse gnubg output data and return structured information.
 
+        data is a single gnubg reply: the controller resets its buffer at every
+        prompt, so each scan covers only the newly arrived output.
+
         Returns:
             dict with keys:
             - gnubg_info: list of detected flags
@@ -237,19 +297,16 @@ class OutputParser:
             - gnubg_move: optional list of moves
             - prompt: optional prompt status
         """
+        # Cheap single scan first: noise without any indicator skips all detectors
+        if not _INDICATOR_RE.search(data):
+            return {"gnubg_info": ["not_readable"]}
+
         result: Dict[str, Any] = {}
         gnubg_info = self.parse_gnubg_info(data)
         result["gnubg_info"] = gnubg_info
 
         if "board_detected" in gnubg_info:
-            result["content_from_board"] = {
-                "gnubg_is": self.find_gnubg_player(data),
-                "has_to_roll_O": self.has_to_roll(data,"O"),
-                "has_to_roll_X": self.has_to_roll(data,"X"),
-                "dice_O": self.parse_dice(data, "O"),
-                "dice_X": self.parse_dice(data, "X"),
-                "X_has_to_move": bool(self.parse_dice(data, "X"))
-            }
+            result["content_from_board"] = self.parse_board_block(data)
 
         if "gnubg_move_detected" in gnubg_info:
             result["gnubg_move"] = self.parse_turn_move_gnubg(data)
@@ -3,8 +3,9 @@
 # =========================================================
 
 import os
+from bisect import bisect_left
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Union, TextIO, Set
 
 from core.board import BAR_FIELD, BEAR_OFF_ANCHOR 
 from core.moves import SingleMoveType, SingleMove, TurnMove
@@ -25,7 +26,8 @@ class GnuBGMoveResolver:
         engine: GameEngine,
         dice_dict: Dict[str, Optional[List[int]]],
         gnubg_prop: Dict[str, Any],
-        log_file: Optional[str] = None
+        log_file: Optional[str] = None,
+        log_stream: Optional[TextIO] = None
     ) -> None:
         """
         Initialize the move resolver.
@@ -35,6 +37,7 @@ class GnuBGMoveResolver:
             dice_dict: Dictionary mapping tokens to dice lists.
             gnubg_prop: GNUBG properties containing 'engine_id' and 'token'.
             log_file: Optional file path to log applied moves.
+            log_stream: Optional open handle on the log file; used instead of reopening it per move.
         """
         self.engine = engine
         self.dice_dict = dice_dict
@@ -42,19 +45,37 @@ class GnuBGMoveResolver:
         self.engine_id = gnubg_prop["engine_id"]
         self.token = gnubg_prop["token"]
 
+        # GNUBG point token -> engine point, with and without the hit marker
+        anchor = BEAR_OFF_ANCHOR[self.engine_id]
+        self._points: Dict[str, int] = {"bar": BAR_FIELD[self.engine_id], "off": anchor}
+        for point in range(1, 25):
+            self._points[str(point)] = self._points[f"{point}*"] = anchor - point
+
         self.process_dice_dict()
      
         self.log_file = log_file
+        self.log_stream = log_stream
+
+        # Set view of engine.legal_moves, rebuilt only when the engine hands out a new list
+        self._legal_src: Optional[List[TurnMove]] = None
+        self._legal_set: Set[TurnMove] = set()
+
         if log_file:
             os.makedirs(os.path.dirname(log_file), exist_ok=True)
      
     def process_dice_dict(self) -> None:
         """
         Double dice in case of doubles (e.g., [3,3] -> [3,3,3,3]).
+
+        The resolved player's dice are then kept sorted ascending, so the move
+        helpers can pick and split dice without sorting or scanning.
         """
         for token, d in self.dice_dict.items():
             if d and d[0] == d[1]:
                 self.dice_dict[token] += d
+        own = self.dice_dict.get(self.token)
+        if own:
+            own.sort()
 
     def gnubg_to_engine_point(self, p: str) -> int:
         """
@@ -66,6 +87,9 @@ class GnuBGMoveResolver:
         Returns:
             Engine point index.
         """
+        point = self._points.get(p)
+        if point is not None:
+            return point
         p_clean = p.replace("*", "")
         if p_clean == "bar":
             return BAR_FIELD[self.engine_id]
@@ -97,12 +121,25 @@ class GnuBGMoveResolver:
         Args:
             sm: SingleMove object to log.
         """
-        if self.log_file:
+        if not self.log_file and self.log_stream is None:
+            return
+        line = (
+            f"{datetime.now().strftime('%H:%M:%S')} - Applied Move: "
+            f"{sm.from_point} -> {sm.to_point}, die={sm.die}, type={sm.move_type}\n"
+        )
+        if self.log_stream is not None:
+            self.log_stream.write(line)
+        else:
             with open(self.log_file, "a", encoding="utf-8") as f:
-                f.write(
-                    f"{datetime.now().strftime('%H:%M:%S')} - Applied Move: "
-                    f"{sm.from_point} -> {sm.to_point}, die={sm.die}, type={sm.move_type}\n"
-                )
+                f.write(line)
+
+    def _is_legal_turn(self, turn: TurnMove) -> bool:
+        """Return True if turn is one of the engine's current legal turn moves."""
+        legal = self.engine.legal_moves
+        if legal is not self._legal_src:
+            self._legal_src = legal
+            self._legal_set = set(legal)
+        return turn in self._legal_set
 
     def _try_single_die_move(self, from_point: int, to_point: int, move_type: SingleMoveType) -> bool:
         """
@@ -120,17 +157,17 @@ class GnuBGMoveResolver:
         if not dice:
             return False
         
-        die = abs(to_point - from_point)
-        candidates = [d for d in dice if d >= die]
-        if not candidates:
+        # Smallest die that covers the distance (dice are sorted)
+        idx = bisect_left(dice, abs(to_point - from_point))
+        if idx == len(dice):
             return False
-        die = min(candidates)
+        die = dice[idx]
 
         sm = SingleMove(player=self.engine_id, from_point=from_point, to_point=to_point, die=die, move_type=move_type)
         self.engine.state.apply_move(sm)
         self._log_move(sm)
 
-        dice.remove(die)
+        del dice[idx]
         if len(dice) == 0:
             self.dice_dict[self.token] = None
         return True
@@ -151,7 +188,7 @@ class GnuBGMoveResolver:
         if not dice or len(dice) < 2 or dice[0] == dice[1]:
             return False  
 
-        d1, d2 = sorted(dice)
+        d1, d2 = dice
         for first_die, second_die in [(d1, d2), (d2, d1)]:
             mid = from_point + first_die
             if mid > to_point:  
@@ -159,7 +196,7 @@ class GnuBGMoveResolver:
             sm1 = SingleMove(player=self.engine_id, from_point=from_point, to_point=mid, die=first_die, move_type=SingleMoveType.NORMAL)
             sm2 = SingleMove(player=self.engine_id, from_point=mid, to_point=to_point, die=second_die, move_type=move_type)
             turn = TurnMove([sm1, sm2])
-            if turn in self.engine.legal_moves:
+            if self._is_legal_turn(turn):
                 self.engine.state.apply_move(sm1)
                 self._log_move(sm1)
                 self.engine.state.apply_move(sm2)
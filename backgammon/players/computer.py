@@ -4,9 +4,11 @@
 
 import random
 import math
-from copy import deepcopy
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Optional
 
+import numpy as np
+
 from core.state import BackgammonState
 from core.rules import BackgammonRules
 from core.generator import TurnMoveGenerator
@@ -17,6 +19,36 @@ from .valuation import Valuation
 
 # =========================================================
 
+#: Number of rollout dice drawn from the NumPy generator per buffer refill.
+ROLLOUT_DICE_BUFFER_SIZE = 4096
+
+#: GammonBot used by a rollout worker process, created on its first task.
+_worker_bot: Optional["GammonBot"] = None
+
+
+def _rollout_worker(state: BackgammonState, depth: int, seed: int) -> float:
+    """
+    Run one rollout in a worker process (see GammonBot.select_move).
+
+    Args:
+        state (BackgammonState): Position after the candidate move (a pickled copy).
+        depth (int): Number of turns to simulate.
+        seed (int): Seed for the worker's move choice and dice.
+
+    Returns:
+        float: Rollout reward.
+    """
+    global _worker_bot
+    if _worker_bot is None:
+        _worker_bot = GammonBot()
+    # Zobrist keys are drawn per process, so rehash with this process' table
+    state.update_zobrist_hash()
+    random.seed(seed)
+    _worker_bot._dice_rng = np.random.default_rng(seed)
+    _worker_bot._dice_buf = []
+    return _worker_bot.rollout(state, depth)
+
+
 class GammonBot:
     """
     AI bot for Backgammon using weighted heuristics, rollouts, and UCB1 for move selection.
@@ -25,20 +57,38 @@ class GammonBot:
         rules (BackgammonRules): Rules engine instance.
         tmgen (TurnMoveGenerator): Turn move generator.
         eval (Valuation): Heuristic evaluation object.
-        eval_cache (dict): Optional cache for evaluation results.
+        eval_cache (dict): Evaluation cache of the valuation, keyed by (hash, player).
     """
 
-    def __init__(self, valuation: Optional[Valuation] = None):
+    def __init__(self, valuation: Optional[Valuation] = None, workers: int = 0):
         """
         Initialize the GammonBot.
 
         Args:
             valuation (Optional[Valuation]): Custom evaluation object. Defaults to None.
+            workers (int, optional): Number of worker processes for rollouts. With 0
+                (default) all rollouts run in this process.
         """
         self.rules: BackgammonRules = BackgammonRules()
         self.tmgen: TurnMoveGenerator = TurnMoveGenerator()
         self.eval: Valuation = valuation or Valuation(self.rules)
-        self.eval_cache: dict = {}
+        # evaluate() goes through Valuation, which memoizes by (hash, player); expose that table
+        self.eval_cache: dict = self.eval.eval_cache
+
+        # Rollout dice come from a buffered NumPy generator seeded from the random
+        # module, so random.seed() still makes rollouts reproducible.
+        self._dice_rng: np.random.Generator = np.random.default_rng(random.getrandbits(64))
+        self._dice_buf: List[int] = []
+        self._dice_idx: int = 0
+
+        self.workers: int = workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def close(self) -> None:
+        """Shut down the rollout worker processes, if any were started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
 
     # ---------------- Evaluation ----------------
     def evaluate(self, state: BackgammonState, player: int) -> float:
@@ -55,6 +105,15 @@ class GammonBot:
         return self.eval.evaluate_state_heuristic(state, player)
 
     # ---------------- Rollout ----------------
+    def _roll_dice(self) -> List[int]:
+        """Return the next two rollout dice from the buffer, refilling it when drained."""
+        idx = self._dice_idx
+        if idx + 2 > len(self._dice_buf):
+            self._dice_buf = self._dice_rng.integers(1, 7, ROLLOUT_DICE_BUFFER_SIZE, dtype=np.int8).tolist()
+            idx = 0
+        self._dice_idx = idx + 2
+        return self._dice_buf[idx:idx + 2]
+
     def rollout(self, state: BackgammonState, depth: int) -> float:
         """
         Perform a random rollout up to a certain depth and evaluate the resulting state.
@@ -68,14 +127,15 @@ class GammonBot:
         """
         count = 0
         turn = state.turn
-        applied_moves: List[SingleMove] = []
 
         if self.rules.game_over(state, 1):
             return self.evaluate(state, turn)
 
+        # One snapshot restores the whole rollout instead of undoing every move
+        snap = state.snapshot()
+
         while count < depth:
-            dice = [random.randint(1, 6), random.randint(1, 6)]
-            dice = self.rules.process_dice(dice)
+            dice = self.rules.process_dice(self._roll_dice())
 
             moves = self.tmgen.generate_legal_moves(state, self.rules, dice)
             if not moves:
@@ -86,18 +146,14 @@ class GammonBot:
             move = random.choice(moves)
             for sm in move:
                 state.apply_move(sm)
-                applied_moves.append(sm)
 
             state.switch_turn()
             count += 1
 
         reward = self.evaluate(state, turn)
 
-        # undo moves
-        while applied_moves:
-            sm = applied_moves.pop()
-            state.undo_move(sm)
-        state.turn = turn
+        state.restore(snap)
+        state.set_turn(turn)
 
         return reward
 
@@ -117,6 +173,26 @@ class GammonBot:
             float: UCB1 score.
         """
         return (value / visits) + c * math.sqrt(math.log(total_visits + 1) / visits)
+
+    @staticmethod
+    def best_ucb1(values: np.ndarray, visits: np.ndarray, total_visits: int, c: float = 1.0) -> int:
+        """
+        Return the index with the highest UCB1 score, vectorized over all moves.
+
+        Same formula as ucb1; the log term is shared by all moves, so it is taken
+        once with math.log. Ties resolve to the lowest index, as with max().
+
+        Args:
+            values (np.ndarray): Total value per move (float64).
+            visits (np.ndarray): Visit count per move (int64).
+            total_visits (int): Sum of all visit counts.
+            c (float, optional): Exploration parameter. Defaults to 1.0.
+
+        Returns:
+            int: Index of the move to explore next.
+        """
+        log_total = math.log(total_visits + 1)
+        return int(np.argmax(values / visits + c * np.sqrt(log_total / visits)))
     
     # ---------------- Move selection ----------------
     
@@ -131,7 +207,12 @@ class GammonBot:
         """
         Select the best move using UCB1 and rollout simulations.
 
-        Ensures that the root state is unchanged after each iteration.
+        With workers > 0, each UCB1 step runs up to `workers` rollouts of the
+        chosen move in parallel (each with its own seed) and adds all rewards
+        before the next selection; iterations still counts single rollouts.
+
+        In debug mode (state.debug), checks that the root state is unchanged
+        after each iteration.
 
         Args:
             state (BackgammonState): Current game state.
@@ -144,10 +225,14 @@ class GammonBot:
             List[SingleMove]: Selected best move.
         """
         player = state.turn
-        moves_eval: dict = {}
+        num_moves = len(legal_moves)
+        values = np.empty(num_moves, dtype=np.float64)
+        visits = np.ones(num_moves, dtype=np.int64)
+        total_visits = num_moves
         applied_moves: list[SingleMove] = []
 
-        # store hash of the root state
+        # store hash of the root state (only checked in debug mode)
+        debug = state.debug
         root_hash = state.zobrist_hash
 
         # initialize move evaluations
@@ -156,52 +241,55 @@ class GammonBot:
                 state.apply_move(sm)
                 applied_moves.append(sm)
 
-            moves_eval[id] = {
-                'value': self.evaluate(state, player),
-                'visits': 1
-            }
+            values[id] = self.evaluate(state, player)
 
             while applied_moves:
                 sm = applied_moves.pop()
                 state.undo_move(sm)
 
+        if self.workers > 0 and self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+
         # UCB1-based simulations
-        for _ in range(iterations):
-            total_visits = sum(m['visits'] for m in moves_eval.values())
-            id = max(
-                moves_eval,
-                key=lambda i: self.ucb1(
-                    moves_eval[i]['value'],
-                    moves_eval[i]['visits'],
-                    total_visits,
-                    c=1.0
-                )
-            )
+        remaining = iterations
+        while remaining > 0:
+            id = self.best_ucb1(values, visits, total_visits, c=1.0)
 
             move = legal_moves[id]
 
             # determine rollout depth
-            depth = min_depth + int((moves_eval[id]['visits'] / 10) * (max_depth - min_depth))
+            depth = min_depth + int((int(visits[id]) / 10) * (max_depth - min_depth))
             depth = min(depth, max_depth)
 
             for sm in move:
                 state.apply_move(sm)
                 applied_moves.append(sm)
 
-            reward = self.rollout(state, depth)
+            if self._pool is None:
+                rewards = [self.rollout(state, depth)]
+            else:
+                batch = min(self.workers, remaining)
+                child = state.copy()
+                futures = [self._pool.submit(_rollout_worker, child, depth, random.getrandbits(64))
+                           for _ in range(batch)]
+                rewards = [future.result() for future in futures]
 
             while applied_moves:
                 sm = applied_moves.pop()
                 state.undo_move(sm)
 
-            moves_eval[id]['value'] += reward
-            moves_eval[id]['visits'] += 1
+            for reward in rewards:
+                values[id] += reward
+                visits[id] += 1
+                total_visits += 1
+            remaining -= len(rewards)
 
             # check that root state is unchanged
-            assert state.zobrist_hash == root_hash, "Root state was modified during move selection!"
+            if debug:
+                assert state.zobrist_hash == root_hash, "Root state was modified during move selection!"
 
         # return best move
-        id_best = max(moves_eval, key=lambda i: moves_eval[i]['value'] / moves_eval[i]['visits'])
+        id_best = int(np.argmax(values / visits))
         return legal_moves[id_best]
 
 
@@ -219,15 +307,19 @@ class ComputerPlayer(Player):
         comp (GammonBot): The underlying AI bot instance.
     """
 
-    def __init__(self, id: int):
+    # rollouts apply and undo moves on the state passed to select_move
+    needs_state_copy: bool = True
+
+    def __init__(self, id: int, workers: int = 0):
         """
         Initialize a computer player.
 
         Args:
             id (int): Player index (0 or 1).
+            workers (int, optional): Rollout worker processes, see GammonBot. Defaults to 0.
         """
         self.id: int = id
-        self.comp: GammonBot = GammonBot()
+        self.comp: GammonBot = GammonBot(workers=workers)
 
     def __str__(self) -> str:
         """
@@ -90,12 +90,9 @@ class HumanPlayer(Player):
         Returns:
             bool: True if player offers to double, False otherwise.
         """
-        return (
-            self.input_offer(f"\n Offer double (cube={cube_value})? [y/N]: ")
-            .strip()
-            .lower()
-            == "y"
-        )
+        # Same answers as .strip().lower() == "y", without the lowered copy
+        answer = self.input_offer(f"\n Offer double (cube={cube_value})? [y/N]: ")
+        return answer.strip() in ("y", "Y")
 
     def accept_double(self, cube_value: int, state: BackgammonState) -> bool:
         """
@@ -108,10 +105,6 @@ class HumanPlayer(Player):
         Returns:
             bool: True if player accepts the double, False if declines.
         """
-        return (
-            self.input_accept(f"\n Accept double to {cube_value * 2}? [Y/n]: ")
-            .strip()
-            .lower()
-            != "n"
-        )
+        answer = self.input_accept(f"\n Accept double to {cube_value * 2}? [Y/n]: ")
+        return answer.strip() not in ("n", "N")
 
@@ -17,8 +17,12 @@ class Player(ABC):
 
     Attributes:
         id (Optional[int]): Player index (0 or 1). Initialized in constructor.
+        needs_state_copy (bool): True if select_move mutates the state it is given;
+            the engine then passes a copy instead of the live state.
     """
 
+    needs_state_copy: bool = False
+
     def __init__(self, id: Optional[int] = None):
         """
         Initialize a player with an optional ID.
@@ -38,6 +42,9 @@ class Player(ABC):
         """
         Select a move from a list of legal moves.
 
+        The state is the engine's live state and must be treated as read-only,
+        unless needs_state_copy is set.
+
         Args:
             moves (List[TurnMove]): List of legal turn moves.
             state (BackgammonState): Current game state.
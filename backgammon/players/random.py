@@ -59,7 +59,8 @@ class RandomPlayer(Player):
         """
         if not moves:
             return None
-        return self.rng.choice(moves)
+        # randrange draws the same index as choice() with fewer checks per call
+        return moves[self.rng.randrange(len(moves))]
 
     # ---------------- Cube heuristics ----------------
     def offer_double(self, cube_value: int, state: BackgammonState) -> bool:
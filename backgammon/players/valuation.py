@@ -3,16 +3,31 @@
 # =========================================================
 
 import math
-from typing import Optional, Dict, Tuple
+from collections import OrderedDict
+from operator import mul
+from typing import List, Optional, Tuple
 
-from core.board import BOARD_START, BOARD_END, HOME_MASK
+from core.board import BOARD_START, BOARD_END, HOME_START, HOME_END, HOME_MASK
+from core.moves import TurnMove
 from core.state import BackgammonState
 from core.rules import BackgammonRules
 
-from utils.bitmask import remove_from_mask, indices_from_bits, count_bits, mask_intersection_count
+from utils.bitmask import remove_from_mask, mask_intersection_count
 
 # =========================================================
 
+#: Pip weights of the board points BOARD_START..BOARD_END for the evaluated player
+#: (point index) and for the opponent (distance from the far end).
+PIP_WEIGHTS_SELF = tuple(range(BOARD_START, BOARD_END + 1))
+PIP_WEIGHTS_OPP = tuple(BOARD_END + 1 - p for p in range(BOARD_START, BOARD_END + 1))
+
+#: Score bonus per game result type for the winner (the loser gets the negative).
+GAME_OVER_SCORE = {"WIN": 0.6, "GAMMON": 0.8, "BACKGAMMON": 1.0}
+
+#: Default maximum number of cached evaluations; the least recently used entry is evicted first.
+EVAL_CACHE_SIZE = 100_000
+
+
 class Valuation:
     """
     Player state evaluation with weighted heuristics.
@@ -20,7 +35,9 @@ class Valuation:
     
     Attributes:
         rules (BackgammonRules): Reference to the rules engine.
-        eval_cache (Dict[Tuple[int,int], float]): Cache for heuristic evaluations keyed by (hash, player).
+        eval_cache (OrderedDict[Tuple[int,int], float]): LRU cache for heuristic evaluations keyed by
+            (hash, player), holding at most cache_size entries.
+        cache_size (int): Capacity of eval_cache.
         w_bear_off (float): Weight for stones borne off.
         w_home (float): Weight for stones in home board.
         w_blots (float): Weight for unprotected stones (blots).
@@ -36,9 +53,11 @@ class Valuation:
                  weight_blots: float = 3.0,
                  weight_blockades: float = 1.0,
                  weight_pip: float = 0.1,
-                 normalization_factor: float = 225.0):
+                 normalization_factor: float = 225.0,
+                 cache_size: int = EVAL_CACHE_SIZE):
         self.rules: BackgammonRules = rules
-        self.eval_cache: Dict[Tuple[int, int], float] = {}
+        self.eval_cache: OrderedDict[Tuple[int, int], float] = OrderedDict()
+        self.cache_size: int = cache_size
 
         self.w_bear_off: float = weight_bear_off
         self.w_home: float = weight_home
@@ -62,7 +81,7 @@ class Valuation:
         """
         opp = 1 - player
         blots_mask = remove_from_mask(state._occ_mask[player], state._blocked_mask[opp])
-        return int(bin(blots_mask).count("1"))
+        return blots_mask.bit_count()
 
     @staticmethod
     def count_home_stones(state: BackgammonState, player: int) -> int:
@@ -76,8 +95,37 @@ class Valuation:
         Returns:
             int: Number of stones in home board.
         """
-        home_indices = indices_from_bits(state._occ_mask[player] & HOME_MASK[player])
-        return sum(state.num_of_stones(p, player) for p in home_indices)
+        # Empty home points count zero, so the whole home slice can be summed
+        return sum(state._counts[player][HOME_START[player]:HOME_END[player] + 1])
+
+    # ---------------- Weighted terms ----------------
+    # Shared by the evaluate_* methods and evaluate_state_heuristic; they take
+    # the masks and count lists already loaded from the state.
+    def _bear_off_term(self, bear_off: List[int], player: int, opp: int) -> float:
+        """Weighted bear-off difference from the bear-off counters."""
+        return self.w_bear_off * (bear_off[player] - bear_off[opp])
+
+    def _home_term(self, counts_p: List[int], counts_o: List[int], player: int, opp: int) -> float:
+        """Weighted home board difference; empty home points count zero, so the slices are summed."""
+        home_p = sum(counts_p[HOME_START[player]:HOME_END[player] + 1])
+        home_o = sum(counts_o[HOME_START[opp]:HOME_END[opp] + 1])
+        return self.w_home * (home_p - home_o)
+
+    def _blots_term(self, occ: List[int], blocked: List[int], player: int, opp: int) -> float:
+        """Weighted blot term: own points not held with 2+ stones count against the player."""
+        blots_p = (occ[player] & ~blocked[opp]).bit_count()
+        blots_o = (occ[opp] & ~blocked[player]).bit_count()
+        return -self.w_blots * blots_p + self.w_blots * blots_o
+
+    def _blockades_term(self, blocked: List[int], player: int, opp: int) -> float:
+        """Weighted blockade difference (blocked[p] marks the points p holds against the opponent)."""
+        return self.w_blockades * (blocked[player].bit_count() - blocked[opp].bit_count())
+
+    def _pip_term(self, counts_p: List[int], counts_o: List[int]) -> float:
+        """Weighted pip term from the plain-int count lists and the precomputed weights."""
+        pip_p = sum(map(mul, counts_p[BOARD_START:BOARD_END + 1], PIP_WEIGHTS_SELF))
+        pip_o = sum(map(mul, counts_o[BOARD_START:BOARD_END + 1], PIP_WEIGHTS_OPP))
+        return -self.w_pip * pip_p + self.w_pip * pip_o
 
     # ---------------- Sub-evaluations ----------------
     def evaluate_bear_off(self, state: BackgammonState, player: int) -> float:
@@ -93,8 +141,7 @@ class Valuation:
         Returns:
             float: Weighted score for bear-off.
         """
-        opp = 1 - player
-        return self.w_bear_off * (int(state.bear_off_stones[player]) - int(state.bear_off_stones[opp]))
+        return self._bear_off_term(state.bear_off_stones.tolist(), player, 1 - player)
 
     def evaluate_home(self, state: BackgammonState, player: int) -> float:
         """
@@ -108,7 +155,7 @@ class Valuation:
             float: Weighted score for home board presence.
         """
         opp = 1 - player
-        return self.w_home * (self.count_home_stones(state, player) - self.count_home_stones(state, opp))
+        return self._home_term(state._counts[player], state._counts[opp], player, opp)
 
     def evaluate_blots(self, state: BackgammonState, player: int) -> float:
         """
@@ -121,8 +168,7 @@ class Valuation:
         Returns:
             float: Weighted score for blots (negative for own blots, positive for opponent's blots).
         """
-        opp = 1 - player
-        return -self.w_blots * self.count_blots(state, player) + self.w_blots * self.count_blots(state, opp)
+        return self._blots_term(state._occ_mask, state._blocked_mask, player, 1 - player)
 
     def evaluate_blockades(self, state: BackgammonState, player: int) -> float:
         """
@@ -135,8 +181,7 @@ class Valuation:
         Returns:
             float: Weighted score for blockades.
         """
-        opp = 1 - player
-        return self.w_blockades * (count_bits(state._blocked_mask[player]) - count_bits(state._blocked_mask[opp]))
+        return self._blockades_term(state._blocked_mask, player, 1 - player)
 
     def evaluate_pip_penalty(self, state: BackgammonState, player: int) -> float:
         """
@@ -149,9 +194,7 @@ class Valuation:
         Returns:
             float: Weighted pip score (negative for player, positive for opponent).
         """
-        opp = 1 - player
-        return -self.w_pip * sum(int(state.num_of_stones(p, player)) * p for p in range(BOARD_START, BOARD_END + 1)) \
-               + self.w_pip * sum(int(state.num_of_stones(p, opp)) * (BOARD_END + 1 - p) for p in range(BOARD_START, BOARD_END +1))
+        return self._pip_term(state._counts[player], state._counts[1 - player])
 
     # ---------------- Full evaluation ----------------
     def evaluate_state_heuristic(self, state: BackgammonState, player: int) -> float:
@@ -159,6 +202,8 @@ class Valuation:
         Evaluate the full state for the given player using weighted heuristics.
 
         Includes bear-off, home, blots, blockades, pip penalty, and game-over bonus.
+        The sub-evaluations share the weighted-term helpers with the evaluate_*
+        methods, fed from masks and counts loaded once.
 
         Args:
             state (BackgammonState): Current game state.
@@ -168,31 +213,64 @@ class Valuation:
             float: Normalized evaluation score in [-0.4, 0.4].
         """
         h: Tuple[int,int] = (state.zobrist_hash, player)
-        if h in self.eval_cache:
-            return self.eval_cache[h]
+        cached = self.eval_cache.get(h)
+        if cached is not None:
+            self.eval_cache.move_to_end(h)
+            return cached
 
         score: float = 0
-        game_over = self.rules.game_over(state, 1)
-        game_over_score = {"WIN": 0.6, "GAMMON": 0.8, "BACKGAMMON": 1.0}
+        # _all_borne_off is the flag game_over tests first; skip the call while nobody is done
+        game_over = self.rules.game_over(state, 1) if state._all_borne_off else None
 
         if game_over:
             if game_over.winner == player:
-                score += game_over_score[game_over.type]
+                score += GAME_OVER_SCORE[game_over.type]
             else:
-                score -= game_over_score[game_over.type]
+                score -= GAME_OVER_SCORE[game_over.type]
 
-        # weighted sub-evaluations
-        score += self.evaluate_bear_off(state, player)
-        score += self.evaluate_home(state, player)
-        score += self.evaluate_blots(state, player)
-        score += self.evaluate_blockades(state, player)
-        score += self.evaluate_pip_penalty(state, player)
+        # weighted sub-evaluations, from masks and counts loaded once
+        opp = 1 - player
+        blocked = state._blocked_mask
+        counts_p, counts_o = state._counts[player], state._counts[opp]
+        score += self._bear_off_term(state.bear_off_stones.tolist(), player, opp)
+        score += self._home_term(counts_p, counts_o, player, opp)
+        score += self._blots_term(state._occ_mask, blocked, player, opp)
+        score += self._blockades_term(blocked, player, opp)
+        score += self._pip_term(counts_p, counts_o)
 
         # normalization
         score = 0.4 * math.tanh(score / self.norm_factor)
         self.eval_cache[h] = score
+        if len(self.eval_cache) > self.cache_size:
+            self.eval_cache.popitem(last=False)
         return score
 
+    # ---------------- Move ordering ----------------
+    def order_moves(self, moves: List[TurnMove], state: BackgammonState, player: int) -> List[TurnMove]:
+        """
+        Sort turn moves by a cheap one-ply score, best first (for search move ordering).
+
+        Each move is applied, scored by bear-off and blots only (popcounts and two
+        counters, no pip sums or cache traffic), and undone again.
+
+        Args:
+            moves (List[TurnMove]): Candidate turn moves.
+            state (BackgammonState): Current game state; restored before returning.
+            player (int): Player index the moves are scored for.
+
+        Returns:
+            List[TurnMove]: The moves ordered by descending score; ties keep their order.
+        """
+        keyed: List[Tuple[float, int]] = []
+        for idx, move in enumerate(moves):
+            for sm in move:
+                state.apply_move(sm)
+            keyed.append((self.evaluate_bear_off(state, player) + self.evaluate_blots(state, player), idx))
+            for sm in reversed(move.single_moves):
+                state.undo_move(sm)
+        keyed.sort(key=lambda item: item[0], reverse=True)
+        return [moves[idx] for _, idx in keyed]
+
     # ---------------- Cube heuristics ----------------
     def offer_double_heuristic(self, state: BackgammonState, player: int) -> bool:
         """
@@ -221,9 +299,9 @@ class Valuation:
             bool: True if cube should be accepted, False otherwise.
         """
         opp = 1 - player
+        # Cheap counter test first; the home count is only needed once it passes
+        if state.bear_off_stones[opp] < 3:
+            return True
         opp_home = mask_intersection_count(HOME_MASK[opp], state._occ_mask[opp])
-        opp_bear_off = state.bear_off_stones[opp]
-        if opp_bear_off >= 3 and opp_home >= 12:
-            return False
-        return True
+        return opp_home < 12
 
@@ -4,7 +4,7 @@ def bits_from_indices(indices):
     """Erzeugt eine Maske aus Boardpunkten (1-basiert)."""
     mask = 0
     for i in indices:
-        mask |= 1 << i
+        mask |= 1 << int(i)  # numpy indices would turn the mask into a numpy scalar
     return mask
 
 
@@ -56,9 +56,9 @@ def remove_from_mask(mask, remove):
 
 def count_bits(mask: int) -> int:
     """Zählt, wie viele Bits in einer Bitmaske gesetzt sind."""
-    return int(bin(mask).count("1"))
+    return mask.bit_count()  # popcount without building the binary string
 
 def mask_intersection_count(mask1: int, mask2: int) -> int:
     """Zählt die gesetzten Bits im AND zweier Masken."""
-    return count_bits(mask1 & mask2)
+    return (mask1 & mask2).bit_count()
 